@@ -1,24 +1,34 @@
 #!/usr/bin/env python3
 import tkinter as tk
 from tkinter import ttk, messagebox
+from tkinter import font as tkfont
 import sqlite3
+import base64
 import hashlib
+import io
+import json
+import pathlib
 import secrets
 import sys
+import threading
+import time
+from collections import OrderedDict, deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timedelta
+from enum import Enum
+from functools import lru_cache
 
-# Report generation imports (focus on preview only)
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
+# Report generation libraries (matplotlib, reportlab) are imported by the
+# report code on first use so they never slow down startup
 
 # =============================================================================
 # CONFIGURATION
 # =============================================================================
 # Database configuration
-DB_PATH = "finance_app.db"
-DB_BACKUP_PATH = "finance_app_backup.db"
+# Resolved once, next to this script, so the database does not depend on the launch directory
+DB_PATH = pathlib.Path(__file__).resolve().parent / "finance_app.db"
+DB_BACKUP_PATH = DB_PATH.with_name("finance_app_backup.db")
 # UI Configuration
 WINDOW_SIZE = "1024x768"
 WINDOW_TITLE = "Finance Management"
@@ -37,6 +47,8 @@ COLORS = {
     'CYAN_GREEN': "#00FFBF",
     'DARK_GREY': "#D0D0D0"
 }
+# Interned so repeated colour options share one string object
+COLORS = {name: sys.intern(value) for name, value in COLORS.items()}
 # Font configuration with Arial fallback
 FONT_FAMILY = ('inter', 'Arial')  # Try inter first, then Arial
 FONTS = {
@@ -65,18 +77,35 @@ FONTS = {
 # Security configuration
 PASSWORD_MIN_LENGTH = 6
 SALT_LENGTH = 16
-# Default data
-DEFAULT_ACCOUNTS = [
-    {"name": "My Bank Account", "balance": 0.00, "type": "Bank"},
-    {"name": "Cash Wallet", "balance": 0.00, "type": "Cash"},
-]
-DEFAULT_CATEGORIES = [
-    {"name": "Food & Drink", "type": "Expense"},
-    {"name": "Transport", "type": "Expense"},
-    {"name": "Salary", "type": "Income"},
-    {"name": "Education", "type": "Expense"},
-    {"name": "Entertainment", "type": "Expense"},
-]
+# Account and category types, matching the CHECK constraints in the schema
+class AccountType(str, Enum):
+    """Account types stored in Account.AccountType"""
+    BANK = "Bank"
+    CASH = "Cash"
+    SAVINGS = "Savings"
+    # Format as the stored value, including in f-strings on Python 3.12+
+    __str__ = str.__str__
+class CategoryType(str, Enum):
+    """Category types stored in Category.CategoryType"""
+    INCOME = "Income"
+    EXPENSE = "Expense"
+    __str__ = str.__str__
+ACCOUNT_TYPES = tuple(t.value for t in AccountType)
+CATEGORY_TYPES = tuple(t.value for t in CategoryType)
+# Default data - read-only seed rows copied into every new user's tables
+SeedAccount = namedtuple('SeedAccount', ['name', 'balance', 'type'])
+SeedCategory = namedtuple('SeedCategory', ['name', 'type'])
+DEFAULT_ACCOUNTS = (
+    SeedAccount("My Bank Account", 0.00, AccountType.BANK),
+    SeedAccount("Cash Wallet", 0.00, AccountType.CASH),
+)
+DEFAULT_CATEGORIES = (
+    SeedCategory("Food & Drink", CategoryType.EXPENSE),
+    SeedCategory("Transport", CategoryType.EXPENSE),
+    SeedCategory("Salary", CategoryType.INCOME),
+    SeedCategory("Education", CategoryType.EXPENSE),
+    SeedCategory("Entertainment", CategoryType.EXPENSE),
+)
 # Account limits
 ACCOUNT_LIMITS = {
     'MAX_ACCOUNTS_PER_USER': 5
@@ -94,17 +123,81 @@ SAVINGS_CONFIG = {
     'MAX_MONTHLY_WITHDRAWALS': 6,
     'WITHDRAWAL_WARNING_THRESHOLD': 4
 }
+# Digest of the security-relevant settings above, checked once at startup to catch
+# accidental edits; update it (see config_digest) whenever these values change
+CONFIG_SHA256 = "d87e6f8275f9d48c95bece0b957f3bb2496bf65f5cb4d160155433ffbb53ed49"
+def config_digest():
+    """SHA-256 of the seed data, limits and validation rules"""
+    # JSON keeps the payload identical across Python versions (enum reprs are not)
+    payload = json.dumps([PASSWORD_MIN_LENGTH, SALT_LENGTH, DEFAULT_ACCOUNTS, DEFAULT_CATEGORIES,
+                          ACCOUNT_LIMITS, VALIDATION, SAVINGS_CONFIG], sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
 # Budget configuration
 BUDGET_CONFIG = {
     'WARNING_THRESHOLD': 0.7,  # 70% threshold for red warning
-    'TIME_PERIODS': ['Week', 'Month', 'Year']
+    'TIME_PERIODS': ('Week', 'Month', 'Year'),
+    'CLEANUP_INTERVAL': 300  # Seconds between expired-budget sweeps
 }
+# Report settings
+REPORT_CONFIG = {
+    'RECENT_LIMIT': 10,  # Rows shown under "Recent Transactions"
+    'CHART_PLACEHOLDER_HEIGHT': 360,  # Space kept for a preview chart until it is drawn
+    'PIE_MAX_SLICES': 8,  # Largest expense categories drawn; the rest become "Other"
+    'PIE_MIN_LABEL_PCT': 3,  # Slices below this percentage get no percentage label
+    'PREVIEW_DPI': 72,  # On-screen preview charts only; the PDF renders at its own DPI
+    'TREND_MARKER_LIMIT': 50  # Trend lines with more days than this are drawn without markers
+}
+# matplotlib settings for the on-screen previews: let Agg drop sub-pixel vertices on long lines
+PREVIEW_RC_PARAMS = {'path.simplify': True, 'path.simplify_threshold': 1.0, 'agg.path.chunksize': 10000}
 # Default saving goal
 DEFAULT_SAVING_GOAL = {
     'name': 'Saving is a good Habit',
     'target_amount': 0.0,
     'is_default': True
 }
+# Management tab layouts - fields are (label, widget, attribute, values, default)
+FORM_SPECS = {
+    'accounts': {
+        'tab': 'Accounts', 'header': 'My Accounts',
+        'list_frame': 'accounts_list_frame', 'add_text': 'Add Account',
+        'fields': [
+            ('Account Name:', 'entry', 'account_name_var', None, None),
+            ('Type:', 'combo', 'account_type_combo', ACCOUNT_TYPES, None),
+        ]
+    },
+    'categories': {
+        'tab': 'Categories', 'header': 'My Categories',
+        'list_frame': 'categories_list_frame', 'add_text': 'Add Category',
+        'fields': [
+            ('Category Name:', 'entry', 'category_name_var', None, None),
+            ('Type:', 'combo', 'category_type_combo', CATEGORY_TYPES, None),
+        ]
+    },
+    'saving_goals': {
+        'tab': 'Saving Goals', 'header': 'Saving Goals',
+        'list_frame': 'saving_goals_list_frame', 'add_text': 'Add Goal',
+        'fields': [
+            ('Goal Name:', 'entry', 'goal_name_var', None, None),
+            ('Target Amount:', 'entry', 'target_amount_var', None, None),
+            ('Current Saving:', 'entry', 'current_saving_var', None, None),
+        ]
+    },
+    'budgets': {
+        'tab': 'Budgets', 'header': 'Budgets',
+        'list_frame': 'budgets_list_frame', 'add_text': 'Add Budget',
+        'fields': [
+            ('Category:', 'combo', 'budget_category_combo', None, None),
+            ('Budget Amount:', 'entry', 'budget_amount_var', None, None),
+            ('Time Period:', 'combo', 'time_combo', BUDGET_CONFIG['TIME_PERIODS'], 'Month'),
+        ]
+    }
+}
+# Two-decimal amount formatter bound once for the dashboard refresh loops
+_fmt2 = "{:.2f}".format
+# Per-row lookups that replace chained conditionals in the list and report loops
+TRANSACTION_PREFIX = {'Income': '+', 'Expense': '-', 'Transfer': '→'}
+# Budget progress colours by spent fraction, checked from the highest threshold down
+BUDGET_PROGRESS_COLORS = ((0.8, COLORS['RED']), (0.6, COLORS['YELLOW']), (float('-inf'), COLORS['GREEN']))
 
 # =============================================================================
 # MODELS
@@ -136,6 +229,42 @@ def is_valid_amount(amount):
 def is_positive_amount(amount):
     """Check if amount is positive"""
     return amount > 0
+@lru_cache(maxsize=4096)
+def parse_iso_datetime(value):
+    """Parse a stored ISO timestamp; results are cached since the same dates recur"""
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+@lru_cache(maxsize=4096)
+def parse_day(value):
+    """Parse a YYYY-MM-DD string, caching repeated days"""
+    return datetime.strptime(value, "%Y-%m-%d")
+@lru_cache(maxsize=8192)
+def format_bdt(amount):
+    """Format an amount as 'x.xx BDT', caching the values that recur across rows"""
+    return f"{amount:.2f} BDT"
+def format_display_date(date_created):
+    """Format a stored ISO date as dd/mm/YYYY for display"""
+    # Fast path: stored dates start with YYYY-MM-DD, so just rearrange the slices
+    if date_created and len(date_created) >= 10 and date_created[4] == '-' and date_created[7] == '-':
+        return f"{date_created[8:10]}/{date_created[5:7]}/{date_created[0:4]}"
+    try:
+        return parse_iso_datetime(date_created).strftime("%d/%m/%Y")
+    except (AttributeError, ValueError):
+        return (date_created or '')[:10]
+# Named Tk fonts created from FONTS, kept alive here so Tk does not delete them
+_NAMED_FONTS = {}
+def register_named_fonts(root):
+    """Register every FONTS entry as a named Tk font and point FONTS at the names"""
+    for key, spec in FONTS.items():
+        if key == 'FAMILY' or key in _NAMED_FONTS:
+            continue
+        # Copies the resolved attributes of the tuple, so widgets render exactly as before
+        _NAMED_FONTS[key] = tkfont.Font(root=root, name=key, font=spec)
+        FONTS[key] = key
+@lru_cache(maxsize=None)
+def cached_font(family, size, weight='normal'):
+    """Return one shared Tk Font per (family, size, weight) for inline font specs"""
+    # Requires the Tk root; every caller runs after FinanceApp has created it
+    return tkfont.Font(family=family, size=size, weight=weight)
 class User:
     """Simple user class"""
     def __init__(self, user_id=None, name="", email="", password="", date_joined=None):
@@ -155,7 +284,7 @@ class User:
         return True, "OK"
 class Account:
     """Simple account class"""
-    def __init__(self, account_id=None, user_id=0, name="", balance=0.0, account_type="Bank"):
+    def __init__(self, account_id=None, user_id=0, name="", balance=0.0, account_type=AccountType.BANK):
         self.account_id = account_id
         self.user_id = user_id
         self.name = name
@@ -169,13 +298,12 @@ class Account:
             return False, "Invalid user"
         if not is_valid_amount(self.balance):
             return False, "Invalid balance"
-        valid_types = ["Bank", "Cash", "Savings"]
-        if self.account_type not in valid_types:
+        if self.account_type not in ACCOUNT_TYPES:
             return False, "Invalid account type"
         return True, "OK"
 class Category:
     """Simple category class"""
-    def __init__(self, category_id=None, user_id=0, name="", category_type="Expense"):
+    def __init__(self, category_id=None, user_id=0, name="", category_type=CategoryType.EXPENSE):
         self.category_id = category_id
         self.user_id = user_id
         self.name = name
@@ -186,8 +314,7 @@ class Category:
             return False, "Category name required"
         if self.user_id <= 0:
             return False, "Invalid user"
-        valid_types = ["Income", "Expense"]
-        if self.category_type not in valid_types:
+        if self.category_type not in CATEGORY_TYPES:
             return False, "Invalid category type"
         return True, "OK"
 class Transaction:
@@ -234,13 +361,17 @@ class Transaction:
         return True, "OK" 
 class SavingGoal:
     """Saving goal model with validation"""
+    __slots__ = ('goal_id', 'user_id', 'goal_name', '_target_amount', '_current_amount',
+                 'account_id', 'is_default', 'date_created', '_progress_pct', '_is_completed_cache')
     def __init__(self, goal_id, user_id=0, goal_name="", target_amount=0.0,
                  current_amount=0.0, account_id=None, is_default=False, date_created=None):
         self.goal_id = goal_id
         self.user_id = user_id
         self.goal_name = goal_name
-        self.target_amount = target_amount
-        self.current_amount = current_amount
+        self._target_amount = target_amount
+        self._current_amount = current_amount
+        self._progress_pct = None
+        self._is_completed_cache = None
         self.account_id = account_id
         self.is_default = is_default
         self.date_created = date_created or datetime.now().isoformat()
@@ -255,14 +386,35 @@ class SavingGoal:
         if not is_valid_amount(self.current_amount):
             return False, "Invalid current amount"
         return True, "OK"
+    @property
+    def target_amount(self):
+        """Target amount; setting it clears the cached progress"""
+        return self._target_amount
+    @target_amount.setter
+    def target_amount(self, value):
+        self._target_amount = value
+        self._progress_pct = self._is_completed_cache = None
+    @property
+    def current_amount(self):
+        """Saved amount; setting it clears the cached progress"""
+        return self._current_amount
+    @current_amount.setter
+    def current_amount(self, value):
+        self._current_amount = value
+        self._progress_pct = self._is_completed_cache = None
     def is_completed(self):
         """Check if goal is completed"""
-        return self.current_amount >= self.target_amount and self.target_amount > 0
+        if self._is_completed_cache is None:
+            self._is_completed_cache = self._current_amount >= self._target_amount and self._target_amount > 0
+        return self._is_completed_cache
     def progress_percentage(self):
         """Get progress percentage"""
-        if self.target_amount <= 0:
-            return 0.0
-        return min((self.current_amount / self.target_amount) * 100, 100.0)
+        if self._progress_pct is None:
+            if self._target_amount <= 0:
+                self._progress_pct = 0.0
+            else:
+                self._progress_pct = min((self._current_amount / self._target_amount) * 100, 100.0)
+        return self._progress_pct
 class Budget:
     """Budget model with validation"""
     VALID_TIME_PERIODS = BUDGET_CONFIG['TIME_PERIODS']
@@ -306,10 +458,10 @@ class Budget:
         return True, "OK"
     def is_expired(self):
         """Check if budget period has expired"""
-        return datetime.now() > datetime.fromisoformat(self.end_date.replace('Z', '+00:00'))
+        return datetime.now() > parse_iso_datetime(self.end_date)
     def days_remaining(self):
         """Get days remaining in budget period"""
-        end_date = datetime.fromisoformat(self.end_date.replace('Z', '+00:00'))
+        end_date = parse_iso_datetime(self.end_date)
         remaining = (end_date - datetime.now()).days
         return max(0, remaining)
 
@@ -318,32 +470,107 @@ class Budget:
 # =============================================================================
 class Database:
     """Simplified database management class"""
+    # Dashboard figures in one statement: this month's income/expense and total balance
+    DASHBOARD_AGGREGATES_SQL = """
+        SELECT COALESCE(SUM(CASE WHEN TransactionType = 'Income' THEN Amount END), 0) AS income,
+               COALESCE(SUM(CASE WHEN TransactionType = 'Expense' THEN Amount END), 0) AS expense,
+               (SELECT COALESCE(SUM(Balance), 0) FROM Account WHERE UserID = :user_id) AS balance
+        FROM Transactions
+        WHERE UserID = :user_id
+        AND TransactionType IN ('Income', 'Expense')
+        AND date(Date_Created) >= date('now', 'start of month')
+    """
+    USER_ACCOUNTS_SQL = "SELECT * FROM Account WHERE UserID = ? ORDER BY Name"
+    USER_CATEGORIES_SQL = "SELECT * FROM Category WHERE UserID = ? ORDER BY CategoryType, Name"
+    USER_SAVING_GOALS_SQL = """
+        SELECT * FROM SavingGoal WHERE UserID = ? ORDER BY IsDefault DESC, Date_Created ASC
+    """
+    USER_BUDGETS_SQL = """
+        SELECT b.*, c.Name as CategoryName,
+               COALESCE(SUM(t.Amount), 0) as SpentAmount
+        FROM Budget b
+        LEFT JOIN Category c ON b.CategoryID = c.CategoryID
+        LEFT JOIN Transactions t ON t.CategoryID = b.CategoryID 
+            AND t.UserID = b.UserID 
+            AND t.TransactionType = 'Expense'
+            AND t.Date_Created >= b.StartDate 
+            AND t.Date_Created <= b.EndDate
+        WHERE b.UserID = ? AND datetime(b.EndDate) > datetime('now')
+        GROUP BY b.BudgetID, c.Name
+        ORDER BY 
+            CASE WHEN (SpentAmount / b.BudgetAmount) >= 0.7 
+            THEN (SpentAmount / b.BudgetAmount) 
+            ELSE -1 
+            END DESC,
+            datetime(b.EndDate) ASC
+    """
+    # Turning a saving goal's account into a regular bank account
+    CONVERT_GOAL_ACCOUNT_SQL = "UPDATE Account SET AccountType = 'Bank', Name = ? WHERE AccountID = ?"
+    DELETE_GOAL_SQL = "DELETE FROM SavingGoal WHERE GoalID = ?"
+    DELETE_GOAL_CELEBRATION_SQL = "DELETE FROM CelebratedGoal WHERE GoalID = ?"
     def __init__(self, db_path=DB_PATH):
         self.db_path = db_path
+        # One long-lived connection shared by the UI thread and the worker thread;
+        # the lock serialises access and the depth lets get_connection nest
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, cached_statements=256)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.executescript("""
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA cache_size=-20000;
+            PRAGMA temp_store=MEMORY;
+        """)
+        self._lock = threading.RLock()
+        self._depth = 0
         self.setup_database()
     
+    @contextmanager
+    def get_connection(self):
+        """Borrow the shared connection; the outermost block commits or rolls back"""
+        with self._lock:
+            self._depth += 1
+            try:
+                yield self._conn
+                if self._depth == 1:
+                    # Inside the guard: a failed COMMIT must not leave the transaction
+                    # open for the next block to commit
+                    self._conn.commit()
+            except Exception:
+                if self._depth == 1:
+                    self._conn.rollback()
+                raise
+            finally:
+                self._depth -= 1
+    
+    @contextmanager
+    def savepoint(self):
+        """Run a block inside the open transaction; on error only this block is undone"""
+        with self.get_connection() as conn:
+            if not conn.in_transaction:
+                # An explicit BEGIN keeps the savepoint from committing on RELEASE
+                conn.execute("BEGIN")
+            conn.execute("SAVEPOINT write_entry")
+            try:
+                yield conn
+            except Exception:
+                conn.execute("ROLLBACK TO write_entry")
+                conn.execute("RELEASE write_entry")
+                raise
+            conn.execute("RELEASE write_entry")
     def execute_query(self, query, params=None, fetch_one=False, fetch_all=False):
         """Simple helper for all database operations"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
         try:
-            cursor = conn.cursor()
-            cursor.execute(query, params or [])
-            
-            if fetch_one:
-                result = cursor.fetchone()
-            elif fetch_all:
-                result = cursor.fetchall()
-            else:
-                result = cursor.lastrowid
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(query, params or [])
                 
-            conn.commit()
-            return result
+                if fetch_one:
+                    return cursor.fetchone()
+                if fetch_all:
+                    return cursor.fetchall()
+                return cursor.lastrowid
         except Exception as e:
-            conn.rollback()
             raise Exception(f"Database error: {e}")
-        finally:
-            conn.close()
     
     def setup_database(self):
         """Create all tables"""
@@ -414,11 +641,19 @@ class Database:
             FOREIGN KEY (UserID) REFERENCES User(UserID),
             FOREIGN KEY (CategoryID) REFERENCES Category(CategoryID)
         );
+        
+        CREATE TABLE IF NOT EXISTS CelebratedGoal (
+            UserID INTEGER NOT NULL,
+            GoalID INTEGER NOT NULL,
+            PRIMARY KEY (UserID, GoalID),
+            FOREIGN KEY (UserID) REFERENCES User(UserID)
+        );
+        
+        CREATE INDEX IF NOT EXISTS idx_txn_user_acct_date ON Transactions(UserID, AccountID, Date_Created);
         """
         
-        conn = sqlite3.connect(self.db_path)
-        conn.executescript(tables)
-        conn.close()
+        with self.get_connection() as conn:
+            conn.executescript(tables)
     def create_user(self, user):
         """Create new user with hashed password"""
         salt = secrets.token_hex(16)
@@ -442,14 +677,14 @@ class Database:
         for acc_data in DEFAULT_ACCOUNTS:
             self.execute_query(
                 "INSERT INTO Account (UserID, Name, AccountType, Balance) VALUES (?, ?, ?, ?)",
-                [user_id, acc_data["name"], acc_data["type"], acc_data["balance"]]
+                [user_id, acc_data.name, acc_data.type, acc_data.balance]
             )
         
         # Default categories
         for cat_data in DEFAULT_CATEGORIES:
             self.execute_query(
                 "INSERT INTO Category (UserID, Name, CategoryType) VALUES (?, ?, ?)",
-                [user_id, cat_data["name"], cat_data["type"]]
+                [user_id, cat_data.name, cat_data.type]
             )
     
     def authenticate_user(self, email, password):
@@ -499,12 +734,8 @@ class Database:
             [account.user_id, account.name, account.account_type, account.balance]
         )
     
-    def get_user_accounts(self, user_id):
-        """Get all accounts for user"""
-        rows = self.execute_query(
-            "SELECT * FROM Account WHERE UserID = ? ORDER BY Name",
-            [user_id], fetch_all=True
-        )
+    def _accounts_from_rows(self, rows):
+        """Build Account models from Account rows"""
         return [Account(
             account_id=row['AccountID'],
             user_id=row['UserID'],
@@ -528,12 +759,8 @@ class Database:
             [category.user_id, category.name, category.category_type]
         )
     
-    def get_user_categories(self, user_id):
-        """Get all categories for user"""
-        rows = self.execute_query(
-            "SELECT * FROM Category WHERE UserID = ? ORDER BY CategoryType, Name",
-            [user_id], fetch_all=True
-        )
+    def _categories_from_rows(self, rows):
+        """Build Category models from Category rows"""
         return [Category(
             category_id=row['CategoryID'],
             user_id=row['UserID'],
@@ -550,59 +777,52 @@ class Database:
         return True
     def create_transaction(self, transaction):
         """Create new transaction and update balances"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
         try:
-            cursor = conn.cursor()
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
             
-            # Insert transaction
-            cursor.execute("""
-                INSERT INTO Transactions (UserID, AccountID, CategoryID, Amount, Description, TransactionType, ToAccountID, Date_Created)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, [transaction.user_id, transaction.account_id, transaction.category_id,
-                  transaction.amount, transaction.description, transaction.transaction_type,
-                  transaction.to_account_id, transaction.date_created])
+                # Insert transaction
+                cursor.execute("""
+                    INSERT INTO Transactions (UserID, AccountID, CategoryID, Amount, Description, TransactionType, ToAccountID, Date_Created)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """, [transaction.user_id, transaction.account_id, transaction.category_id,
+                      transaction.amount, transaction.description, transaction.transaction_type,
+                      transaction.to_account_id, transaction.date_created])
             
-            transaction_id = cursor.lastrowid
+                transaction_id = cursor.lastrowid
             
-            # Update account balances and sync saving goals
-            if transaction.transaction_type == "Income":
-                cursor.execute(
-                    "UPDATE Account SET Balance = Balance + ? WHERE AccountID = ?",
-                    [transaction.amount, transaction.account_id]
-                )
-                # Update saving goal if this is a savings account
-                self._update_saving_goal_from_account(cursor, transaction.account_id)
+                # Update account balances and sync saving goals
+                if transaction.transaction_type == "Income":
+                    cursor.execute(
+                        "UPDATE Account SET Balance = Balance + ? WHERE AccountID = ?",
+                        [transaction.amount, transaction.account_id]
+                    )
+                    # Update saving goal if this is a savings account
+                    self._update_saving_goal_from_account(cursor, transaction.account_id)
                 
-            elif transaction.transaction_type == "Expense":
-                cursor.execute(
-                    "UPDATE Account SET Balance = Balance - ? WHERE AccountID = ?",
-                    [transaction.amount, transaction.account_id]
-                )
-                # Update saving goal if this is a savings account
-                self._update_saving_goal_from_account(cursor, transaction.account_id)
+                elif transaction.transaction_type == "Expense":
+                    cursor.execute(
+                        "UPDATE Account SET Balance = Balance - ? WHERE AccountID = ?",
+                        [transaction.amount, transaction.account_id]
+                    )
+                    # Update saving goal if this is a savings account
+                    self._update_saving_goal_from_account(cursor, transaction.account_id)
                 
-            elif transaction.transaction_type == "Transfer" and transaction.to_account_id:
-                cursor.execute(
-                    "UPDATE Account SET Balance = Balance - ? WHERE AccountID = ?",
-                    [transaction.amount, transaction.account_id]
-                )
-                cursor.execute(
-                    "UPDATE Account SET Balance = Balance + ? WHERE AccountID = ?",
-                    [transaction.amount, transaction.to_account_id]
-                )
-                # Update saving goals for both accounts if they are savings accounts
-                self._update_saving_goal_from_account(cursor, transaction.account_id)
-                self._update_saving_goal_from_account(cursor, transaction.to_account_id)
-            
-            conn.commit()
-            return transaction_id
-            
+                elif transaction.transaction_type == "Transfer" and transaction.to_account_id:
+                    cursor.execute(
+                        "UPDATE Account SET Balance = Balance - ? WHERE AccountID = ?",
+                        [transaction.amount, transaction.account_id]
+                    )
+                    cursor.execute(
+                        "UPDATE Account SET Balance = Balance + ? WHERE AccountID = ?",
+                        [transaction.amount, transaction.to_account_id]
+                    )
+                    # Update saving goals for both accounts if they are savings accounts
+                    self._update_saving_goal_from_account(cursor, transaction.account_id)
+                    self._update_saving_goal_from_account(cursor, transaction.to_account_id)
+                return transaction_id
         except Exception as e:
-            conn.rollback()
             raise Exception(f"Transaction failed: {e}")
-        finally:
-            conn.close()
     def _update_saving_goal_from_account(self, cursor, account_id):
         """Update saving goal amount based on account balance"""
         # Check if this account is associated with a saving goal
@@ -619,19 +839,23 @@ class Database:
             cursor.execute("""
                 UPDATE SavingGoal SET CurrentAmount = ? WHERE GoalID = ?
             """, (result['Balance'], result['GoalID']))
-    def get_user_transactions(self, user_id, limit=50):
-        """Get recent transactions"""
+    def count_user_transactions(self, user_id):
+        """Count all transactions for user"""
+        result = self.execute_query(
+            "SELECT COUNT(*) as total FROM Transactions WHERE UserID = ?",
+            [user_id], fetch_one=True
+        )
+        return result['total']
+    def get_user_transactions_page(self, user_id, offset, limit):
+        """Get one page of transactions without resolving account/category names"""
         rows = self.execute_query("""
-            SELECT t.*, a.Name as AccountName, c.Name as CategoryName,
-                   ta.Name as ToAccountName
-            FROM Transactions t
-            LEFT JOIN Account a ON t.AccountID = a.AccountID
-            LEFT JOIN Category c ON t.CategoryID = c.CategoryID
-            LEFT JOIN Account ta ON t.ToAccountID = ta.AccountID
-            WHERE t.UserID = ?
-            ORDER BY t.Date_Created DESC
-            LIMIT ?
-        """, [user_id, limit], fetch_all=True)
+            SELECT TransactionID, UserID, AccountID, CategoryID, Amount, Description,
+                   TransactionType, ToAccountID, Date_Created
+            FROM Transactions
+            WHERE UserID = ?
+            ORDER BY Date_Created DESC, TransactionID DESC
+            LIMIT ? OFFSET ?
+        """, [user_id, limit, offset], fetch_all=True)
         
         transactions = []
         for row in rows:
@@ -639,52 +863,40 @@ class Database:
                 'transaction_id': row['TransactionID'],
                 'user_id': row['UserID'],
                 'account_id': row['AccountID'],
-                'account_name': row['AccountName'],
                 'category_id': row['CategoryID'],
-                'category_name': row['CategoryName'],
                 'amount': row['Amount'],
                 'description': row['Description'],
                 'transaction_type': row['TransactionType'],
                 'to_account_id': row['ToAccountID'],
-                'to_account_name': row['ToAccountName'],
-                'date_created': row['Date_Created']
+                'date_created': row['Date_Created'],
+                # Parsed once here so page flips never touch datetime
+                'formatted_date': format_display_date(row['Date_Created'])
             })
         return transactions
-    def get_user_balance_summary(self, user_id):
-        """Get total balance, income, and expenses"""
-        # Total balance
-        balance_result = self.execute_query(
-            "SELECT SUM(Balance) as total FROM Account WHERE UserID = ?",
-            [user_id], fetch_one=True
-        )
-        total_balance = balance_result['total'] or 0.0
-        
-        # Monthly income
-        income_result = self.execute_query("""
-            SELECT SUM(Amount) as total FROM Transactions 
-            WHERE UserID = ? AND TransactionType = 'Income' 
-            AND date(Date_Created) >= date('now', 'start of month')
-        """, [user_id], fetch_one=True)
-        monthly_income = income_result['total'] or 0.0
-        
-        # Monthly expenses
-        expense_result = self.execute_query("""
-            SELECT SUM(Amount) as total FROM Transactions 
-            WHERE UserID = ? AND TransactionType = 'Expense' 
-            AND date(Date_Created) >= date('now', 'start of month')
-        """, [user_id], fetch_one=True)
-        monthly_expense = expense_result['total'] or 0.0
-        
+    def get_user_dashboard_bundle(self, user_id):
+        """Load everything refresh_data needs over a single connection"""
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                accounts = cursor.execute(self.USER_ACCOUNTS_SQL, [user_id]).fetchall()
+                categories = cursor.execute(self.USER_CATEGORIES_SQL, [user_id]).fetchall()
+                saving_goals = cursor.execute(self.USER_SAVING_GOALS_SQL, [user_id]).fetchall()
+                budgets = cursor.execute(self.USER_BUDGETS_SQL, [user_id]).fetchall()
+                summary = cursor.execute(self.DASHBOARD_AGGREGATES_SQL, {'user_id': user_id}).fetchone()
+        except Exception as e:
+            raise Exception(f"Database error: {e}")
+        income, expense = summary['income'], summary['expense']
         return {
-            'total_balance': total_balance,
-            'total_savings': 0.0,  # Simplified for now
-            'monthly_income': monthly_income,
-            'monthly_expense': monthly_expense,
-            'monthly_cashflow': monthly_income - monthly_expense
+            'accounts': self._accounts_from_rows(accounts),
+            'categories': self._categories_from_rows(categories),
+            'saving_goals': self._saving_goals_from_rows(saving_goals),
+            'budgets': self._budgets_from_rows(budgets),
+            'summary': (income, expense, summary['balance'], income - expense)
         }
     def close(self):
         """Close database connection"""
-        pass 
+        with self._lock:
+            self._conn.close() 
 
     def create_saving_goal(self, goal):
         """Create a new saving goal and associated saving account"""
@@ -697,7 +909,7 @@ class Database:
         account_id = self.execute_query("""
             INSERT INTO Account (UserID, Name, Balance, AccountType)
             VALUES (?, ?, ?, ?)
-        """, [goal.user_id, account_name, goal.current_amount, "Savings"])
+        """, [goal.user_id, account_name, goal.current_amount, AccountType.SAVINGS])
         
         # Create saving goal  
         goal_id = self.execute_query("""
@@ -709,9 +921,10 @@ class Database:
         return goal_id
     def get_user_saving_goals(self, user_id):
         """Get all saving goals for a user"""
-        rows = self.execute_query("""
-            SELECT * FROM SavingGoal WHERE UserID = ? ORDER BY IsDefault DESC, Date_Created ASC
-        """, [user_id], fetch_all=True)
+        rows = self.execute_query(self.USER_SAVING_GOALS_SQL, [user_id], fetch_all=True)
+        return self._saving_goals_from_rows(rows)
+    def _saving_goals_from_rows(self, rows):
+        """Build SavingGoal models from SavingGoal rows"""
         return [SavingGoal(
             goal_id=row['GoalID'],
             user_id=row['UserID'],
@@ -731,30 +944,33 @@ class Database:
     
     def sync_all_saving_goals(self, user_id):
         """Sync all saving goals with their account balances"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
         try:
-            cursor = conn.cursor()
-            # Get all saving goals with their account balances
-            cursor.execute("""
-                SELECT sg.GoalID, a.Balance
-                FROM SavingGoal sg 
-                INNER JOIN Account a ON sg.AccountID = a.AccountID 
-                WHERE sg.UserID = ?
-            """, (user_id,))
-            
-            for row in cursor.fetchall():
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                # Get all saving goals with their account balances
                 cursor.execute("""
-                    UPDATE SavingGoal SET CurrentAmount = ? WHERE GoalID = ?
-                """, (row['Balance'], row['GoalID']))
-            
-            conn.commit()
+                    SELECT sg.GoalID, a.Balance
+                    FROM SavingGoal sg 
+                    INNER JOIN Account a ON sg.AccountID = a.AccountID 
+                    WHERE sg.UserID = ?
+                """, (user_id,))
+                
+                for row in cursor.fetchall():
+                    cursor.execute("""
+                        UPDATE SavingGoal SET CurrentAmount = ? WHERE GoalID = ?
+                    """, (row['Balance'], row['GoalID']))
         except Exception as e:
-            conn.rollback()
             raise Exception(f"Failed to sync saving goals: {e}")
-        finally:
-            conn.close()
     
+    def get_celebrated_goal_ids(self, user_id):
+        """Get the IDs of goals whose completion was already celebrated"""
+        rows = self.execute_query("SELECT GoalID FROM CelebratedGoal WHERE UserID = ?",
+                                  [user_id], fetch_all=True)
+        return frozenset(row['GoalID'] for row in rows)
+    def mark_goal_celebrated(self, user_id, goal_id):
+        """Remember that a goal's completion has been celebrated"""
+        self.execute_query("INSERT OR IGNORE INTO CelebratedGoal (UserID, GoalID) VALUES (?, ?)",
+                           [user_id, goal_id])
     def get_completed_goals(self, user_id):
         """Get all completed saving goals"""
         rows = self.execute_query("""
@@ -774,25 +990,35 @@ class Database:
         ) for row in rows]
     def delete_saving_goal(self, goal_id, user_id):
         """Delete saving goal and associated account"""
-        # Get account ID first
-        row = self.execute_query("""
-            SELECT AccountID FROM SavingGoal WHERE GoalID = ? AND UserID = ?
-        """, [goal_id, user_id], fetch_one=True)
-        if not row:
-            return False
-        account_id = row['AccountID']
-        
-        # Delete saving goal first (due to foreign key)
-        self.execute_query("""
-            DELETE FROM SavingGoal WHERE GoalID = ? AND UserID = ?
-        """, [goal_id, user_id])
-        
-        # Delete associated account
-        self.execute_query("""
-            DELETE FROM Account WHERE AccountID = ? AND UserID = ?
-        """, [account_id, user_id])
-        
-        return True
+        # Lookup and both deletes run in one transaction with a single commit
+        with self.get_connection():
+            # Get account ID first
+            row = self.execute_query("""
+                SELECT AccountID FROM SavingGoal WHERE GoalID = ? AND UserID = ?
+            """, [goal_id, user_id], fetch_one=True)
+            if not row:
+                return False
+            account_id = row['AccountID']
+            
+            # Delete saving goal first (due to foreign key)
+            self.execute_query("""
+                DELETE FROM SavingGoal WHERE GoalID = ? AND UserID = ?
+            """, [goal_id, user_id])
+            self.execute_query(self.DELETE_GOAL_CELEBRATION_SQL, [goal_id])
+            
+            # Delete associated account
+            self.execute_query("""
+                DELETE FROM Account WHERE AccountID = ? AND UserID = ?
+            """, [account_id, user_id])
+            
+            return True
+    def convert_saving_goal_account(self, goal_id, account_id, account_name):
+        """Turn a saving goal's account into a bank account and drop the goal"""
+        # Both statements share one transaction and a single commit
+        with self.get_connection():
+            self.execute_query(self.CONVERT_GOAL_ACCOUNT_SQL, [account_name, account_id])
+            self.execute_query(self.DELETE_GOAL_SQL, [goal_id])
+            self.execute_query(self.DELETE_GOAL_CELEBRATION_SQL, [goal_id])
     def get_saving_accounts(self, user_id):
         """Get all saving accounts for a user"""
         rows = self.execute_query("""
@@ -836,41 +1062,14 @@ class Database:
               budget.start_date, budget.end_date, budget.date_created])
     def get_user_budgets_with_spending(self, user_id):
         """Get all active budgets for a user with spending calculations"""
-        rows = self.execute_query("""
-            SELECT b.*, c.Name as CategoryName,
-                   COALESCE(SUM(CASE 
-                       WHEN t.TransactionType = 'Expense' 
-                       AND t.Date_Created >= b.StartDate 
-                       AND t.Date_Created <= b.EndDate 
-                       THEN t.Amount 
-                       ELSE 0 
-                   END), 0) as SpentAmount
-            FROM Budget b
-            LEFT JOIN Category c ON b.CategoryID = c.CategoryID
-            LEFT JOIN Transactions t ON t.CategoryID = b.CategoryID AND t.UserID = b.UserID
-            WHERE b.UserID = ? AND datetime(b.EndDate) > datetime('now')
-            GROUP BY b.BudgetID, c.Name
-            ORDER BY 
-                CASE WHEN (COALESCE(SUM(CASE 
-                    WHEN t.TransactionType = 'Expense' 
-                    AND t.Date_Created >= b.StartDate 
-                    AND t.Date_Created <= b.EndDate 
-                    THEN t.Amount 
-                    ELSE 0 
-                END), 0) / b.BudgetAmount) >= 0.7 
-                THEN (COALESCE(SUM(CASE 
-                    WHEN t.TransactionType = 'Expense' 
-                    AND t.Date_Created >= b.StartDate 
-                    AND t.Date_Created <= b.EndDate 
-                    THEN t.Amount 
-                    ELSE 0 
-                END), 0) / b.BudgetAmount) 
-                ELSE -1 
-                END DESC,
-                datetime(b.EndDate) ASC
-        """, [user_id], fetch_all=True)
-        
+        rows = self.execute_query(self.USER_BUDGETS_SQL, [user_id], fetch_all=True)
+        return self._budgets_from_rows(rows)
+    def _budgets_from_rows(self, rows):
+        """Build budget dicts with spending figures from USER_BUDGETS_SQL rows"""
         budgets = []
+        # Loop-invariant values, read once per batch instead of per budget
+        warning_threshold = BUDGET_CONFIG['WARNING_THRESHOLD']
+        now = datetime.now()
         for row in rows:
             spent_percentage = (row['SpentAmount'] / row['BudgetAmount']) if row['BudgetAmount'] > 0 else 0
             remaining = max(0, row['BudgetAmount'] - row['SpentAmount'])
@@ -886,8 +1085,8 @@ class Database:
                 'time_period': row['TimePeriod'],
                 'start_date': row['StartDate'],
                 'end_date': row['EndDate'],
-                'is_over_threshold': spent_percentage >= BUDGET_CONFIG['WARNING_THRESHOLD'],
-                'days_remaining': max(0, (datetime.fromisoformat(row['EndDate']) - datetime.now()).days)
+                'is_over_threshold': spent_percentage >= warning_threshold,
+                'days_remaining': max(0, (parse_iso_datetime(row['EndDate']) - now).days)
             })
         return budgets
     def delete_budget(self, budget_id, user_id):
@@ -991,7 +1190,7 @@ class LoginScreen:
         header_frame.pack_propagate(False)
         # Title in header
         title_label = tk.Label(header_frame, text="Finance Manager", 
-                              font=('inter', 20, 'bold'), 
+                              font=cached_font('inter', 20, 'bold'), 
                               fg=COLORS['WHITE'], 
                               bg=COLORS['BLACK'])
         title_label.pack(expand=True)
@@ -1000,20 +1199,20 @@ class LoginScreen:
         body_frame.pack(fill='both', expand=True, padx=30, pady=20)
         # Email label and entry
         email_label = tk.Label(body_frame, text="Email", 
-                              font=('inter', 12, 'bold'), 
+                              font=cached_font('inter', 12, 'bold'), 
                               fg=COLORS['BLACK'], bg=COLORS['LIGHT_GREY'])
         email_label.pack(anchor='w', pady=(0, 5))
         self.email_entry = tk.Entry(body_frame, textvariable=self.email_var, 
-                                   font=('inter', 12, 'normal'), 
+                                   font=cached_font('inter', 12, 'normal'), 
                                    relief='solid', bd=2, bg=COLORS['WHITE'])
         self.email_entry.pack(fill='x', pady=(0, 15), ipady=8)
         # Password label and entry
         password_label = tk.Label(body_frame, text="Password", 
-                                 font=('inter', 12, 'bold'), 
+                                 font=cached_font('inter', 12, 'bold'), 
                                  fg=COLORS['BLACK'], bg=COLORS['LIGHT_GREY'])
         password_label.pack(anchor='w', pady=(0, 5))
         self.password_entry = tk.Entry(body_frame, textvariable=self.password_var, 
-                                      font=('inter', 12, 'normal'), 
+                                      font=cached_font('inter', 12, 'normal'), 
                                       show="*", relief='solid', bd=2, bg=COLORS['WHITE'])
         self.password_entry.pack(fill='x', pady=(0, 20), ipady=8)
         # Bind Enter key to login
@@ -1021,13 +1220,13 @@ class LoginScreen:
         self.password_entry.bind("<Return>", lambda e: self.login())
         # Login button
         login_btn = tk.Button(body_frame, text="Login", 
-                             font=('inter', 14, 'bold'), 
+                             font=cached_font('inter', 14, 'bold'), 
                              bg=COLORS['CYAN_GREEN'], fg=COLORS['BLACK'], 
                              command=self.login, relief='flat', bd=0)
         login_btn.pack(fill='x', pady=(0, 10), ipady=12)
         # Register button
         register_btn = tk.Button(body_frame, text="Register", 
-                                font=('inter', 14, 'bold'), 
+                                font=cached_font('inter', 14, 'bold'), 
                                 bg=COLORS['DARK_GREY'], fg=COLORS['BLACK'], 
                                 command=self.on_show_register, relief='flat', bd=0)
         register_btn.pack(fill='x', pady=(0, 10), ipady=12)
@@ -1087,7 +1286,7 @@ class RegisterScreen:
         header_frame.pack_propagate(False)
         # Title in header
         title_label = tk.Label(header_frame, text="Create Account", 
-                              font=('inter', 18, 'bold'), 
+                              font=cached_font('inter', 18, 'bold'), 
                               fg=COLORS['WHITE'], 
                               bg=COLORS['BLACK'])
         title_label.pack(expand=True)
@@ -1096,29 +1295,29 @@ class RegisterScreen:
         body_frame.pack(fill='both', expand=True, padx=30, pady=15)
         # Name label and entry
         name_label = tk.Label(body_frame, text="Name", 
-                             font=('inter', 11, 'bold'), 
+                             font=cached_font('inter', 11, 'bold'), 
                              fg=COLORS['BLACK'], bg=COLORS['LIGHT_GREY'])
         name_label.pack(anchor='w', pady=(0, 3))
         self.name_entry = tk.Entry(body_frame, textvariable=self.name_var, 
-                                  font=('inter', 11, 'normal'), 
+                                  font=cached_font('inter', 11, 'normal'), 
                                   relief='solid', bd=2, bg=COLORS['WHITE'])
         self.name_entry.pack(fill='x', pady=(0, 10), ipady=6)
         # Email label and entry
         email_label = tk.Label(body_frame, text="Email", 
-                              font=('inter', 11, 'bold'), 
+                              font=cached_font('inter', 11, 'bold'), 
                               fg=COLORS['BLACK'], bg=COLORS['LIGHT_GREY'])
         email_label.pack(anchor='w', pady=(0, 3))
         self.email_entry = tk.Entry(body_frame, textvariable=self.email_var, 
-                                   font=('inter', 11, 'normal'), 
+                                   font=cached_font('inter', 11, 'normal'), 
                                    relief='solid', bd=2, bg=COLORS['WHITE'])
         self.email_entry.pack(fill='x', pady=(0, 10), ipady=6)
         # Password label and entry
         password_label = tk.Label(body_frame, text="Password", 
-                                 font=('inter', 11, 'bold'), 
+                                 font=cached_font('inter', 11, 'bold'), 
                                  fg=COLORS['BLACK'], bg=COLORS['LIGHT_GREY'])
         password_label.pack(anchor='w', pady=(0, 3))
         self.password_entry = tk.Entry(body_frame, textvariable=self.password_var, 
-                                      font=('inter', 11, 'normal'), 
+                                      font=cached_font('inter', 11, 'normal'), 
                                       show="*", relief='solid', bd=2, bg=COLORS['WHITE'])
         self.password_entry.pack(fill='x', pady=(0, 15), ipady=6)
         # Bind Enter key to register
@@ -1127,13 +1326,13 @@ class RegisterScreen:
         self.password_entry.bind("<Return>", lambda e: self.register())
         # Register button
         register_btn = tk.Button(body_frame, text="Create Account", 
-                                font=('inter', 13, 'bold'), 
+                                font=cached_font('inter', 13, 'bold'), 
                                 bg=COLORS['CYAN_GREEN'], fg=COLORS['BLACK'], 
                                 command=self.register, relief='flat', bd=0)
         register_btn.pack(fill='x', pady=(0, 10), ipady=12)
         # Back to login button
         back_btn = tk.Button(body_frame, text="Back to Login", 
-                            font=('inter', 13, 'bold'), 
+                            font=cached_font('inter', 13, 'bold'), 
                             bg=COLORS['DARK_GREY'], fg=COLORS['BLACK'], 
                             command=self.on_show_login, relief='flat', bd=0)
         back_btn.pack(fill='x', pady=(0, 10), ipady=12)
@@ -1259,8 +1458,8 @@ class IncomePopup(TransactionPopup):
     def __init__(self, parent, database, user, 
                  accounts, categories,
                  on_success):
-        income_categories = [c for c in categories if c.category_type == "Income"]
-        super().__init__(parent, database, user, accounts, "Add Income", "Income", on_success, income_categories)
+        # categories are the user's income categories, already filtered by the caller
+        super().__init__(parent, database, user, accounts, "Add Income", "Income", on_success, categories)
     def setup_specific_fields(self):
         """Setup income-specific fields"""
         # Category dropdown
@@ -1314,8 +1513,8 @@ class ExpensePopup(TransactionPopup):
     def __init__(self, parent, database, user,
                  accounts, categories,
                  on_success):
-        expense_categories = [c for c in categories if c.category_type == "Expense"]
-        super().__init__(parent, database, user, accounts, "Add Expense", "Expense", on_success, expense_categories)
+        # categories are the user's expense categories, already filtered by the caller
+        super().__init__(parent, database, user, accounts, "Add Expense", "Expense", on_success, categories)
     def setup_specific_fields(self):
         """Setup expense-specific fields"""
         # Category dropdown
@@ -1398,7 +1597,7 @@ class TransferPopup(PopupWindow):
                                font=FONTS['BUTTON'], bg=COLORS['WHITE'])
         amount_label.grid(row=0, column=0, sticky="nsew", ipadx=3, ipady=4)
         amount_entry = tk.Entry(self.popup, textvariable=self.amount_var, 
-                               font=('inter', 18, 'normal'), bg=COLORS['WHITE'])
+                               font=cached_font('inter', 18, 'normal'), bg=COLORS['WHITE'])
         amount_entry.grid(row=0, column=1, sticky="nsew", ipady=3)
         # From Account row
         from_label = tk.Label(self.popup, text="From", anchor='w', 
@@ -1563,7 +1762,8 @@ class BudgetPopup(PopupWindow):
         super().__init__(parent, "Add Budget", "400x250")
         self.database = database
         self.user = user
-        self.categories = [c for c in categories if c.category_type == "Expense"]
+        # Expense categories, already filtered by the caller
+        self.categories = categories
         self.on_success = on_success
         self.budget_amount_var = tk.StringVar()
         self.setup_ui()
@@ -1647,17 +1847,61 @@ class MainApp:
         self.categories = []
         self.saving_goals = []
         self.budgets = []
+        self._account_name_by_id = {}
+        self._category_name_by_id = {}
+        # Lists pre-split by type on every refresh
+        self._categories_by_type = {}
+        self._savings_accounts = []
+        self._regular_accounts = []
+        self._last_budget_cat_sig = None
+        self._expense_category_ids = ()
         self.selected_account_index = -1
         self.selected_category_index = -1
         self.selected_saving_goal_index = -1
         self.selected_budget_index = -1
+        # (button, unselected colour) pairs so selection only recolours two buttons
+        self._account_buttons = []
+        self._category_buttons = []
+        self._saving_goal_buttons = []
+        self._budget_buttons = []
+        self._refresh_pending = False
+        # Last (prev state, next state, label text) applied to each dashboard pager
+        self._page_controls_state = {}
+        # Recently generated reports, most recent last
+        self._report_cache = OrderedDict()
+        # (report_data, report_type) currently shown in the preview
+        self._last_preview = None
+        # One matplotlib Figure per preview chart slot, reused across previews
+        self._preview_figures = {}
+        # Preview canvas and the (placeholder, build, args) charts not yet scrolled into view
+        self._preview_canvas = None
+        self._pending_charts = []
+        # Goals already celebrated, kept across sessions
+        self._celebrated_goals = self.database.get_celebrated_goal_ids(self.user.user_id)
+        # Single celebration popup, built on first use, and the goals waiting for it
+        self._celebration_popup = None
+        self._celebration_goal = None
+        self._celebration_queue = []
+        # Monotonic time of the last expired-budget sweep (None until the first)
+        self._last_cleanup_ts = None
+        # Single worker so database reads never block the Tk event loop
+        self._db_executor = ThreadPoolExecutor(max_workers=1)
+        # Separate worker rasterises report charts so rendering never queues behind queries
+        self._render_executor = ThreadPoolExecutor(max_workers=1)
+        # Preview Figures the render worker still owns; they must not be reused yet
+        self._figures_in_flight = set()
+        # Writes waiting for the next flush, as (func, args, on_success, failure_message)
+        self._pending_writes = deque()
+        self._flush_scheduled = False
+        # Write batches handed to the worker and not yet reported back, by future
+        self._write_futures = {}
+        # Ids of this screen's pending after() callbacks, cancelled by close()
+        self._after_ids = set()
         self.setup_ui()
-        self.refresh_data()
+        # Load data once the shell has been painted
+        self._after(None, self.refresh_data)
     def setup_ui(self):
         """Setup the main application UI"""
-        # Clear the window
-        for widget in self.parent.winfo_children():
-            widget.destroy()
         # Welcome header
         welcome_frame = tk.Frame(self.parent, bg=COLORS['BLACK'], height=40)
         welcome_frame.pack(fill='x')
@@ -1669,16 +1913,50 @@ class MainApp:
                               bg=COLORS['RED'], fg=COLORS['WHITE'], command=self.on_logout, 
                               relief='flat', bd=0, padx=15, pady=5)
         logout_btn.pack(side='right', padx=15, pady=8)
-        # Create Notebook (tabs)
-        self.notebook = ttk.Notebook(self.parent)
-        self.notebook.pack(fill='both', expand=True)
-        # Setup tabs
-        self.setup_dashboard()
-        self.setup_accounts_tab()
-        self.setup_categories_tab()
-        self.setup_saving_goals_tab()
-        self.setup_budgets_tab()
-        self.setup_reports_tab()
+        # Shared ttk styles, resolved once instead of per-widget colour options
+        self._style = ttk.Style(self.parent)
+        self._style.configure('Dashboard.TFrame', background=COLORS['FRAME_BG'])
+        self._style.configure('Pager.TLabel', font=cached_font('inter', 10, 'normal'),
+                              foreground=COLORS['GREY'], background=COLORS['FRAME_BG'])
+        # Report preview tables: one Treeview per table instead of a frame and labels per row
+        report_line = tkfont.Font(root=self.parent, font=FONTS['LIST_ITEM']).metrics('linespace')
+        self._style.configure('Report.Treeview', font=FONTS['LIST_ITEM'], rowheight=report_line + 10,
+                              foreground=COLORS['BLACK'], background=COLORS['WHITE'],
+                              fieldbackground=COLORS['WHITE'])
+        self._style.configure('Report.Treeview.Heading', font=FONTS['FORM_LABEL'],
+                              foreground=COLORS['BLACK'], background=COLORS['GREY'])
+        # Build all tabs hidden so geometry is computed once
+        with self._batched_layout(self.parent):
+            # Create Notebook (tabs)
+            self.notebook = ttk.Notebook(self.parent)
+            self.notebook.pack(fill='both', expand=True)
+            # Setup tabs
+            self.setup_dashboard()
+            self.setup_accounts_tab()
+        # Remaining tabs are built one per idle cycle after the dashboard paints
+        self._deferred_tabs = [self.setup_categories_tab, self.setup_saving_goals_tab,
+                               self.setup_budgets_tab, self.setup_reports_tab]
+        self._after(None, self._build_next_deferred_tab)
+    def _build_next_deferred_tab(self):
+        """Build the next deferred tab and schedule the one after it"""
+        if not self._deferred_tabs or not self.notebook.winfo_exists():
+            return
+        self._deferred_tabs.pop(0)()
+        if self._deferred_tabs:
+            self._after(None, self._build_next_deferred_tab)
+    @contextmanager
+    def _batched_layout(self, container):
+        """Hide the window while widgets are built, then show it in one pass"""
+        toplevel = container.winfo_toplevel()
+        propagate = container.pack_propagate()
+        container.pack_propagate(False)
+        toplevel.withdraw()
+        try:
+            yield
+        finally:
+            container.pack_propagate(propagate)
+            toplevel.deiconify()
+            toplevel.update_idletasks()
     def setup_dashboard(self):
         """Setup dashboard tab with 4 quadrants"""
         dash_frame = tk.Frame(self.notebook)
@@ -1707,61 +1985,65 @@ class MainApp:
         self.setup_budget_tracker(frame_bottom_right)
     def setup_balance_section(self, parent_frame):
         """Setup the balance and action buttons section"""
+        # Bind config lookups and widget classes to locals once
+        GREEN, GREY, BLACK, FRAME_BG = COLORS['GREEN'], COLORS['GREY'], COLORS['BLACK'], COLORS['FRAME_BG']
+        FONT_SECTION, FONT_VALUE, FONT_BUTTON = FONTS['SECTION_LABEL'], FONTS['VALUE'], FONTS['BUTTON']
+        tk_Frame, tk_Label, tk_Button = tk.Frame, tk.Label, tk.Button
         # Setup grid for balance and buttons
         parent_frame.grid_rowconfigure(0, weight=1, uniform='a')
         parent_frame.grid_rowconfigure((1,2), weight=1, uniform='a')
         parent_frame.grid_columnconfigure((0,1), weight=1, uniform='a')
         # Balance display
-        self.balance_label = tk.Label(parent_frame, text="0.00 BDT", font=FONTS['BALANCE'], 
-                                     fg=COLORS['GREY'], bg=COLORS['FRAME_BG'])
+        self.balance_label = tk_Label(parent_frame, text="…", font=FONTS['BALANCE'], 
+                                     fg=GREY, bg=FRAME_BG)
         self.balance_label.grid(column=0, row=0, columnspan=2, sticky='nws', padx=10, pady=8)
         # Income section
-        income_frame = tk.Frame(parent_frame, bg=COLORS['GREEN'], relief='solid', bd=1)
+        income_frame = tk_Frame(parent_frame, bg=GREEN, relief='solid', bd=1)
         income_frame.grid(row=1, column=0, sticky='nsew', padx=5, pady=5)
         income_frame.grid_rowconfigure((0,1,2), weight=1, uniform='a')
         income_frame.grid_columnconfigure(0, weight=1)
-        income_label = tk.Label(income_frame, text="Income", font=FONTS['SECTION_LABEL'], 
-                               fg=COLORS['BLACK'], bg=COLORS['GREEN'])
+        income_label = tk_Label(income_frame, text="Income", font=FONT_SECTION, 
+                               fg=BLACK, bg=GREEN)
         income_label.grid(row=0, column=0, sticky='ne', padx=8, pady=4)
-        self.income_value_label = tk.Label(income_frame, text="0.00 BDT", font=FONTS['VALUE'], 
-                                          fg=COLORS['BLACK'], bg=COLORS['GREEN'])
+        self.income_value_label = tk_Label(income_frame, text="…", font=FONT_VALUE, 
+                                          fg=BLACK, bg=GREEN)
         self.income_value_label.grid(row=1, column=0, sticky='n', padx=8, pady=2)
-        add_income_btn = tk.Button(income_frame, text="Add Income", font=FONTS['BUTTON'], 
-                                  fg=COLORS['BLACK'], bg=COLORS['GREEN'], relief='flat', bd=0,
+        add_income_btn = tk_Button(income_frame, text="Add Income", font=FONT_BUTTON, 
+                                  fg=BLACK, bg=GREEN, relief='flat', bd=0,
                                   command=self.open_income_popup)
         add_income_btn.grid(row=2, column=0, sticky='ew', padx=8, pady=6)
         # Expense section
-        expense_frame = tk.Frame(parent_frame, bg=COLORS['GREY'], relief='solid', bd=1)
+        expense_frame = tk_Frame(parent_frame, bg=GREY, relief='solid', bd=1)
         expense_frame.grid(row=1, column=1, sticky='nsew', padx=5, pady=5)
         expense_frame.grid_rowconfigure((0,1,2), weight=1, uniform='a')
         expense_frame.grid_columnconfigure(0, weight=1)
-        expense_label = tk.Label(expense_frame, text="Expense", font=FONTS['SECTION_LABEL'], 
-                                fg=COLORS['BLACK'], bg=COLORS['GREY'])
+        expense_label = tk_Label(expense_frame, text="Expense", font=FONT_SECTION, 
+                                fg=BLACK, bg=GREY)
         expense_label.grid(row=0, column=0, sticky='ne', padx=8, pady=4)
-        self.expense_value_label = tk.Label(expense_frame, text="0.00 BDT", font=FONTS['VALUE'], 
-                                           fg=COLORS['BLACK'], bg=COLORS['GREY'])
+        self.expense_value_label = tk_Label(expense_frame, text="…", font=FONT_VALUE, 
+                                           fg=BLACK, bg=GREY)
         self.expense_value_label.grid(row=1, column=0, sticky='n', padx=8, pady=2)
-        add_expense_btn = tk.Button(expense_frame, text="Add Expense", font=FONTS['BUTTON'], 
-                                   fg=COLORS['BLACK'], bg=COLORS['GREY'], relief='flat', bd=0,
+        add_expense_btn = tk_Button(expense_frame, text="Add Expense", font=FONT_BUTTON, 
+                                   fg=BLACK, bg=GREY, relief='flat', bd=0,
                                    command=self.open_expense_popup)
         add_expense_btn.grid(row=2, column=0, sticky='ew', padx=8, pady=6)
         # Cashflow section (bottom left)
-        cashflow_frame = tk.Frame(parent_frame, bg=COLORS['GREY'], relief='flat', bd=2)
+        cashflow_frame = tk_Frame(parent_frame, bg=GREY, relief='flat', bd=2)
         cashflow_frame.grid(row=2, column=0, sticky='nsew', padx=5, pady=5)
         cashflow_frame.grid_rowconfigure((0,1), weight=1, uniform='a')
         cashflow_frame.grid_columnconfigure(0, weight=1)
-        cashflow_label = tk.Label(cashflow_frame, text="Cashflow", font=FONTS['SECTION_LABEL'], 
-                                 fg=COLORS['BLACK'], bg=COLORS['GREY'])
+        cashflow_label = tk_Label(cashflow_frame, text="Cashflow", font=FONT_SECTION, 
+                                 fg=BLACK, bg=GREY)
         cashflow_label.grid(row=0, column=0, sticky='ne', padx=8, pady=4)
-        self.cashflow_label = tk.Label(cashflow_frame, text="0.00 BDT", font=('inter', 18, 'bold'), 
-                                      fg=COLORS['BLACK'], bg=COLORS['GREY'])
+        self.cashflow_label = tk_Label(cashflow_frame, text="…", font=cached_font('inter', 18, 'bold'), 
+                                      fg=BLACK, bg=GREY)
         self.cashflow_label.grid(row=1, column=0, sticky='n', padx=8, pady=4)
         # Transfer button (bottom right)
-        transfer_frame = tk.Frame(parent_frame, bg=COLORS['GREY'], relief='flat', bd=0)
+        transfer_frame = tk_Frame(parent_frame, bg=GREY, relief='flat', bd=0)
         transfer_frame.grid(row=2, column=1, sticky='nsew', padx=5, pady=5)
-        transfer_btn = tk.Button(transfer_frame, text="Transfer Balance", 
-                                font=FONTS['TRANSACTION_DESC'], fg=COLORS['BLACK'], 
-                                bg=COLORS['GREEN'], relief='flat', bd=0,
+        transfer_btn = tk_Button(transfer_frame, text="Transfer Balance", 
+                                font=FONTS['TRANSACTION_DESC'], fg=BLACK, 
+                                bg=GREEN, relief='flat', bd=0,
                                 command=self.open_transfer_popup)
         transfer_btn.pack(expand=True, fill='both', padx=0, pady=0)
     def setup_placeholder_frame(self, parent_frame, text):
@@ -1776,77 +2058,114 @@ class MainApp:
         parent_frame.grid_rowconfigure(1, weight=0)  # Pagination controls
         parent_frame.grid_columnconfigure(0, weight=1)
         # Transaction list frame (no canvas/scrollbar)
-        self.transaction_list = tk.Frame(parent_frame, bg=COLORS['FRAME_BG'], relief='flat', bd=1)
+        self.transaction_list = ttk.Frame(parent_frame, style='Dashboard.TFrame', borderwidth=1)
         self.transaction_list.grid(row=0, column=0, sticky="nsew", padx=8, pady=8)
+        # Size comes from the dashboard grid, so row changes never re-run layout upwards
+        self.transaction_list.grid_propagate(False)
         self.transaction_list.grid_columnconfigure(0, weight=1)
+        self.transaction_list.grid_rowconfigure(0, weight=1)
         # Pagination variables
         self.current_page = 0
         self.items_per_page = 4
         self.total_pages = 1
+        # Pages are cached per data version; refresh_data bumps the version
+        self._tx_cache_version = 0
+        self._tx_count_version = None
+        self._tx_page_cache = {}
+        self._tx_pending_key = None
+        # Native Treeview rows; two text lines per row, coloured by tag
+        row_font = ('inter', 11, 'normal')
+        # Treeview tags style whole rows, so the bold amount emphasis covers both columns
+        amount_font = ('inter', 11, 'bold')
+        line_height = tkfont.Font(root=self.parent, font=amount_font).metrics('linespace')
+        self._style.configure('Transactions.Treeview', font=row_font, rowheight=line_height * 2 + 14,
+                              foreground=COLORS['BLACK'], background=COLORS['FRAME_BG'],
+                              fieldbackground=COLORS['FRAME_BG'], borderwidth=0)
+        self._style.layout('Transactions.Treeview', [('Treeview.treearea', {'sticky': 'nswe'})])
+        self._tx_tree = ttk.Treeview(self.transaction_list, columns=('desc', 'amt'), show='',
+                                     height=self.items_per_page, selectmode='none',
+                                     style='Transactions.Treeview')
+        self._tx_tree.column('desc', anchor='w', stretch=True)
+        self._tx_tree.column('amt', anchor='e', stretch=False, width=150)
+        self._tx_tree.tag_configure('income', background=COLORS['GREEN'], font=amount_font)
+        self._tx_tree.tag_configure('expense', background=COLORS['GREY'], font=amount_font)
+        self._tx_tree.tag_configure('transfer', background=COLORS['GREY'], font=amount_font)
+        self._tx_tree.grid(row=0, column=0, sticky='nsew')
         # Pagination controls
-        pagination_frame = tk.Frame(parent_frame, bg=COLORS['FRAME_BG'], relief='flat', bd=1)
+        pagination_frame = ttk.Frame(parent_frame, style='Dashboard.TFrame', borderwidth=1)
         pagination_frame.grid(row=1, column=0, sticky="ew", padx=8, pady=(0,8))
         pagination_frame.grid_columnconfigure(1, weight=1)
-        self.prev_btn = tk.Button(pagination_frame, text="Previous", font=('inter', 10, 'normal'), 
+        self.prev_btn = tk.Button(pagination_frame, text="Previous", font=cached_font('inter', 10, 'normal'), 
                                  bg=COLORS['GREY'], fg=COLORS['BLACK'], command=self.prev_page, 
                                  relief='flat', bd=1, padx=15, pady=5)
         self.prev_btn.grid(row=0, column=0, padx=8, pady=5)
-        self.page_label = tk.Label(pagination_frame, text="Page 1 of 1", 
-                                  font=('inter', 10, 'normal'), fg=COLORS['GREY'], bg=COLORS['FRAME_BG'])
+        self.page_label = ttk.Label(pagination_frame, text="Page 1 of 1", style='Pager.TLabel')
         self.page_label.grid(row=0, column=1, pady=5)
-        self.next_btn = tk.Button(pagination_frame, text="Next", font=('inter', 10, 'normal'), 
+        self.next_btn = tk.Button(pagination_frame, text="Next", font=cached_font('inter', 10, 'normal'), 
                                  bg=COLORS['GREY'], fg=COLORS['BLACK'], command=self.next_page, 
                                  relief='flat', bd=1, padx=15, pady=5)
         self.next_btn.grid(row=0, column=2, padx=8, pady=5)
     def display_transactions(self):
         """Display transactions for current page"""
-        # Clear existing transactions
-        for widget in self.transaction_list.winfo_children():
-            widget.destroy()
-        # Get transactions from database
-        all_transactions = self.database.get_user_transactions(self.user.user_id, limit=50)
-        # Calculate pagination
-        self.total_pages = max(1, (len(all_transactions) + self.items_per_page - 1) // self.items_per_page)
-        start_idx = self.current_page * self.items_per_page
-        end_idx = min(start_idx + self.items_per_page, len(all_transactions))
-        page_transactions = all_transactions[start_idx:end_idx]
+        user_id = self.user.user_id
+        # Calculate pagination (count once per data version)
+        if self._tx_count_version != self._tx_cache_version:
+            total = self.database.count_user_transactions(user_id)
+            self.total_pages = max(1, (total + self.items_per_page - 1) // self.items_per_page)
+            self._tx_count_version = self._tx_cache_version
+        self.current_page = min(self.current_page, self.total_pages - 1)
+        # Get only the current page from database
+        cache_key = (user_id, self.current_page, self._tx_cache_version)
+        page_transactions = self._tx_page_cache.get(cache_key)
+        if page_transactions is None:
+            # Fetch on the worker thread; pagination stays disabled until it lands
+            if cache_key != self._tx_pending_key:
+                self._tx_pending_key = cache_key
+                self.prev_btn.config(state="disabled")
+                self.next_btn.config(state="disabled")
+                self._run_in_background(
+                    self.database.get_user_transactions_page,
+                    (user_id, self.current_page * self.items_per_page, self.items_per_page),
+                    lambda future: self._apply_page(cache_key, future))
+            return
+        self._render_transactions(page_transactions)
+    def _apply_page(self, cache_key, future):
+        """Store a page fetched on the worker thread and show it if still wanted"""
+        try:
+            page_transactions = future.result()
+        except Exception as e:
+            self._tx_pending_key = None
+            messagebox.showerror("Database Error", str(e))
+            self.update_transaction_pagination()
+            return
+        # Results fetched before a refresh belong to an old data version
+        if cache_key[2] == self._tx_cache_version:
+            self._tx_page_cache[cache_key] = page_transactions
+        if cache_key == self._tx_pending_key:
+            self._tx_pending_key = None
+            self.display_transactions()
+    def _render_transactions(self, page_transactions):
+        """Render one page of transactions"""
         # Display transactions using 2-column layout from ToBreak
-        for i, transaction in enumerate(page_transactions):
-            frame_bg = COLORS['GREEN'] if transaction["transaction_type"] == "Income" else COLORS['GREY']
-            transaction_item = tk.Frame(self.transaction_list, bg=frame_bg, relief='flat', bd=1)
-            transaction_item.grid(row=i, column=0, sticky='nsew', pady=2, padx=4)
-            transaction_item.grid_columnconfigure(0, weight=1)
-            transaction_item.grid_columnconfigure(1, weight=0)
+        tree = self._tx_tree
+        tree.delete(*tree.get_children())
+        # Bind per-row lookups to locals outside the loop
+        insert = tree.insert
+        account_name_by_id = self._account_name_by_id.get
+        category_name_by_id = self._category_name_by_id.get
+        for transaction in page_transactions:
+            transaction_type = transaction["transaction_type"]
             # Left side - Description and details
-            left_text = f"{transaction['description'] or 'No description'}\n{transaction['account_name']} • {transaction['category_name'] or 'Transfer'}"
-            desc_label = tk.Label(transaction_item, 
-                                 text=left_text,
-                                 font=('inter', 11, 'normal'),
-                                 fg=COLORS['BLACK'],
-                                 bg=frame_bg,
-                                 anchor='w',
-                                 justify='left')
-            desc_label.grid(row=0, column=0, sticky='nsew', padx=8, pady=6)
+            account_name = account_name_by_id(transaction['account_id'], '')
+            category_name = category_name_by_id(transaction['category_id'])
+            left_text = f"{transaction['description'] or 'No description'}\n{account_name} • {category_name or 'Transfer'}"
             # Right side - Amount and date
-            prefix = "+" if transaction["transaction_type"] == "Income" else "-"
-            if transaction["transaction_type"] == "Transfer":
-                prefix = "→"
-            # Format date for display
-            try:
-                date_obj = datetime.fromisoformat(transaction['date_created'].replace('Z', '+00:00'))
-                formatted_date = date_obj.strftime("%d/%m/%Y")
-            except:
-                formatted_date = transaction['date_created'][:10]
-            right_text = f"{prefix}{transaction['amount']:.2f} BDT\n{formatted_date}"
-            amount_label = tk.Label(transaction_item, 
-                                  text=right_text,
-                                  font=('inter', 11, 'bold'),
-                                  fg=COLORS['BLACK'],
-                                  bg=frame_bg,
-                                  anchor='e',
-                                  justify='right')
-            amount_label.grid(row=0, column=1, sticky='nsew', padx=8, pady=6)
-        # Update pagination buttons
+            prefix = TRANSACTION_PREFIX.get(transaction_type, "-")
+            right_text = f"{prefix}{format_bdt(transaction['amount'])}\n{transaction['formatted_date']}"
+            insert('', 'end', values=(left_text, right_text), tags=(transaction_type.lower(),))
+        self.update_transaction_pagination()
+    def update_transaction_pagination(self):
+        """Update pagination buttons"""
         self.prev_btn.config(state="normal" if self.current_page > 0 else "disabled")
         self.next_btn.config(state="normal" if self.current_page < self.total_pages - 1 else "disabled")
         self.page_label.config(text=f"Page {self.current_page + 1} of {self.total_pages}")
@@ -1862,157 +2181,81 @@ class MainApp:
             self.display_transactions()
     def setup_accounts_tab(self):
         """Setup accounts management tab"""
-        accounts_frame = tk.Frame(self.notebook, bg=COLORS['FRAME_BG'])
-        self.notebook.add(accounts_frame, text='Accounts')
-        accounts_frame.grid_rowconfigure(1, weight=1)
-        accounts_frame.grid_columnconfigure(0, weight=1)
+        self._build_crud_tab(FORM_SPECS['accounts'], self.add_account, self.delete_account)
+    def _build_crud_tab(self, spec, on_add, on_delete):
+        """Build a management tab (header, list, form and Add/Delete buttons) from a FORM_SPECS entry"""
+        tab_frame = tk.Frame(self.notebook, bg=COLORS['FRAME_BG'])
+        self.notebook.add(tab_frame, text=spec['tab'])
+        tab_frame.grid_rowconfigure(1, weight=1)
+        tab_frame.grid_columnconfigure(0, weight=1)
         # Header
-        header_label = tk.Label(accounts_frame, text="My Accounts", font=FONTS['HEADER'], 
+        header_label = tk.Label(tab_frame, text=spec['header'], font=FONTS['HEADER'], 
                                fg=COLORS['GREY'], bg=COLORS['FRAME_BG'])
         header_label.grid(row=0, column=0, pady=15, sticky='w', padx=20)
-        # Accounts list
-        self.accounts_list_frame = tk.Frame(accounts_frame, bg=COLORS['FRAME_BG'], relief='flat', bd=2)
-        self.accounts_list_frame.grid(row=1, column=0, sticky='nsew', padx=20, pady=10)
-        self.accounts_list_frame.grid_columnconfigure(0, weight=1)
-        # Add account form
-        form_frame = tk.Frame(accounts_frame, bg=COLORS['FRAME_BG'], relief='flat', bd=2)
+        # Item list
+        list_frame = tk.Frame(tab_frame, bg=COLORS['FRAME_BG'], relief='flat', bd=2)
+        list_frame.grid(row=1, column=0, sticky='nsew', padx=20, pady=10)
+        list_frame.grid_columnconfigure(0, weight=1)
+        setattr(self, spec['list_frame'], list_frame)
+        # Add item form
+        form_frame = tk.Frame(tab_frame, bg=COLORS['FRAME_BG'], relief='flat', bd=2)
         form_frame.grid(row=2, column=0, sticky='ew', padx=20, pady=15)
         form_frame.grid_columnconfigure((0,1,2), weight=1)
-        tk.Label(form_frame, text="Account Name:", font=FONTS['FORM_LABEL'], 
-                fg=COLORS['GREY'], bg=COLORS['FRAME_BG']).grid(row=0, column=0, sticky='w', pady=4, padx=8)
-        self.account_name_var = tk.StringVar()
-        tk.Entry(form_frame, textvariable=self.account_name_var, font=FONTS['FORM_LABEL'],
-                bg=COLORS['WHITE'], fg=COLORS['BLACK'], relief='flat', bd=1).grid(row=1, column=0, sticky='ew', padx=(8,5), ipady=4)
-        tk.Label(form_frame, text="Type:", font=FONTS['FORM_LABEL'], 
-                fg=COLORS['GREY'], bg=COLORS['FRAME_BG']).grid(row=0, column=1, sticky='w', pady=4, padx=8)
-        self.account_type_combo = ttk.Combobox(form_frame, values=["Bank", "Cash", "Savings"], state="readonly")
-        self.account_type_combo.grid(row=1, column=1, sticky='ew', padx=(8,5), ipady=4)
-        add_account_btn = tk.Button(form_frame, text="Add Account", font=FONTS['BUTTON'], 
-                                   bg=COLORS['GREEN'], fg=COLORS['BLACK'], command=self.add_account,
-                                   relief='flat', bd=2, padx=15, pady=6)
-        add_account_btn.grid(row=1, column=2, sticky='ew', padx=8)
-        delete_account_btn = tk.Button(form_frame, text="Delete Selected", font=FONTS['BUTTON'], 
-                                      bg=COLORS['RED'], fg=COLORS['WHITE'], command=self.delete_account,
-                                      relief='flat', bd=2, padx=15, pady=6)
-        delete_account_btn.grid(row=2, column=2, sticky='ew', padx=8, pady=(6,8))
+        for column, (label, widget_type, attribute, values, default) in enumerate(spec['fields']):
+            tk.Label(form_frame, text=label, font=FONTS['FORM_LABEL'], 
+                    fg=COLORS['GREY'], bg=COLORS['FRAME_BG']).grid(row=0, column=column, sticky='w', pady=4, padx=8)
+            if widget_type == 'entry':
+                var = tk.StringVar()
+                setattr(self, attribute, var)
+                field = tk.Entry(form_frame, textvariable=var, font=FONTS['FORM_LABEL'],
+                                bg=COLORS['WHITE'], fg=COLORS['BLACK'], relief='flat', bd=1)
+            else:
+                field = ttk.Combobox(form_frame, values=values or [], state="readonly")
+                if default:
+                    field.set(default)
+                setattr(self, attribute, field)
+            field.grid(row=1, column=column, sticky='ew', padx=(8,5), ipady=4)
+        add_btn = tk.Button(form_frame, text=spec['add_text'], font=FONTS['BUTTON'], 
+                           bg=COLORS['GREEN'], fg=COLORS['BLACK'], command=on_add,
+                           relief='flat', bd=2, padx=15, pady=6)
+        delete_btn = tk.Button(form_frame, text="Delete Selected", font=FONTS['BUTTON'], 
+                              bg=COLORS['RED'], fg=COLORS['WHITE'], command=on_delete,
+                              relief='flat', bd=2, padx=15, pady=6)
+        if len(spec['fields']) < 3:
+            # Buttons stack in the spare third column
+            add_btn.grid(row=1, column=2, sticky='ew', padx=8)
+            delete_btn.grid(row=2, column=2, sticky='ew', padx=8, pady=(6,8))
+        else:
+            # Full-width buttons below the form
+            add_btn.grid(row=2, column=0, columnspan=3, sticky='ew', padx=8, pady=(6,8))
+            delete_btn.grid(row=3, column=0, columnspan=3, sticky='ew', padx=8, pady=(6,8))
+        return tab_frame
     def setup_categories_tab(self):
         """Setup categories management tab"""
-        categories_frame = tk.Frame(self.notebook, bg=COLORS['FRAME_BG'])
-        self.notebook.add(categories_frame, text='Categories')
-        categories_frame.grid_rowconfigure(1, weight=1)
-        categories_frame.grid_columnconfigure(0, weight=1)
-        # Header
-        header_label = tk.Label(categories_frame, text="My Categories", font=FONTS['HEADER'], 
-                               fg=COLORS['GREY'], bg=COLORS['FRAME_BG'])
-        header_label.grid(row=0, column=0, pady=15, sticky='w', padx=20)
-        # Categories list
-        self.categories_list_frame = tk.Frame(categories_frame, bg=COLORS['FRAME_BG'], relief='flat', bd=2)
-        self.categories_list_frame.grid(row=1, column=0, sticky='nsew', padx=20, pady=10)
-        self.categories_list_frame.grid_columnconfigure(0, weight=1)
-        # Add category form
-        form_frame = tk.Frame(categories_frame, bg=COLORS['FRAME_BG'], relief='flat', bd=2)
-        form_frame.grid(row=2, column=0, sticky='ew', padx=20, pady=15)
-        form_frame.grid_columnconfigure((0,1,2), weight=1)
-        tk.Label(form_frame, text="Category Name:", font=FONTS['FORM_LABEL'], 
-                fg=COLORS['GREY'], bg=COLORS['FRAME_BG']).grid(row=0, column=0, sticky='w', pady=4, padx=8)
-        self.category_name_var = tk.StringVar()
-        tk.Entry(form_frame, textvariable=self.category_name_var, font=FONTS['FORM_LABEL'],
-                bg=COLORS['WHITE'], fg=COLORS['BLACK'], relief='flat', bd=1).grid(row=1, column=0, sticky='ew', padx=(8,5), ipady=4)
-        tk.Label(form_frame, text="Type:", font=FONTS['FORM_LABEL'], 
-                fg=COLORS['GREY'], bg=COLORS['FRAME_BG']).grid(row=0, column=1, sticky='w', pady=4, padx=8)
-        self.category_type_combo = ttk.Combobox(form_frame, values=["Income", "Expense"], state="readonly")
-        self.category_type_combo.grid(row=1, column=1, sticky='ew', padx=(8,5), ipady=4)
-        add_category_btn = tk.Button(form_frame, text="Add Category", font=FONTS['BUTTON'], 
-                                    bg=COLORS['GREEN'], fg=COLORS['BLACK'], command=self.add_category,
-                                    relief='flat', bd=2, padx=15, pady=6)
-        add_category_btn.grid(row=1, column=2, sticky='ew', padx=8)
-        delete_category_btn = tk.Button(form_frame, text="Delete Selected", font=FONTS['BUTTON'], 
-                                       bg=COLORS['RED'], fg=COLORS['WHITE'], command=self.delete_category,
-                                       relief='flat', bd=2, padx=15, pady=6)
-        delete_category_btn.grid(row=2, column=2, sticky='ew', padx=8, pady=(6,8))
+        if getattr(self, '_cat_built', False):
+            return
+        self._build_crud_tab(FORM_SPECS['categories'], self.add_category, self.delete_category)
+        self._cat_built = True
+        self.refresh_categories_list()
     def setup_saving_goals_tab(self):
         """Setup saving goals management tab"""
-        saving_goals_frame = tk.Frame(self.notebook, bg=COLORS['FRAME_BG'])
-        self.notebook.add(saving_goals_frame, text='Saving Goals')
-        saving_goals_frame.grid_rowconfigure(1, weight=1)
-        saving_goals_frame.grid_columnconfigure(0, weight=1)
-        # Header
-        header_label = tk.Label(saving_goals_frame, text="Saving Goals", font=FONTS['HEADER'], 
-                               fg=COLORS['GREY'], bg=COLORS['FRAME_BG'])
-        header_label.grid(row=0, column=0, pady=15, sticky='w', padx=20)
-        # Saving goals list
-        self.saving_goals_list_frame = tk.Frame(saving_goals_frame, bg=COLORS['FRAME_BG'], relief='flat', bd=2)
-        self.saving_goals_list_frame.grid(row=1, column=0, sticky='nsew', padx=20, pady=10)
-        self.saving_goals_list_frame.grid_columnconfigure(0, weight=1)
-        # Add saving goal form
-        form_frame = tk.Frame(saving_goals_frame, bg=COLORS['FRAME_BG'], relief='flat', bd=2)
-        form_frame.grid(row=2, column=0, sticky='ew', padx=20, pady=15)
-        form_frame.grid_columnconfigure((0,1,2), weight=1)
-        tk.Label(form_frame, text="Goal Name:", font=FONTS['FORM_LABEL'], 
-                fg=COLORS['GREY'], bg=COLORS['FRAME_BG']).grid(row=0, column=0, sticky='w', pady=4, padx=8)
-        self.goal_name_var = tk.StringVar()
-        tk.Entry(form_frame, textvariable=self.goal_name_var, font=FONTS['FORM_LABEL'],
-                bg=COLORS['WHITE'], fg=COLORS['BLACK'], relief='flat', bd=1).grid(row=1, column=0, sticky='ew', padx=(8,5), ipady=4)
-        tk.Label(form_frame, text="Target Amount:", font=FONTS['FORM_LABEL'], 
-                fg=COLORS['GREY'], bg=COLORS['FRAME_BG']).grid(row=0, column=1, sticky='w', pady=4, padx=8)
-        self.target_amount_var = tk.StringVar()
-        tk.Entry(form_frame, textvariable=self.target_amount_var, font=FONTS['FORM_LABEL'],
-                bg=COLORS['WHITE'], fg=COLORS['BLACK'], relief='flat', bd=1).grid(row=1, column=1, sticky='ew', padx=(8,5), ipady=4)
-        tk.Label(form_frame, text="Current Saving:", font=FONTS['FORM_LABEL'], 
-                fg=COLORS['GREY'], bg=COLORS['FRAME_BG']).grid(row=0, column=2, sticky='w', pady=4, padx=8)
-        self.current_saving_var = tk.StringVar()
-        tk.Entry(form_frame, textvariable=self.current_saving_var, font=FONTS['FORM_LABEL'],
-                bg=COLORS['WHITE'], fg=COLORS['BLACK'], relief='flat', bd=1).grid(row=1, column=2, sticky='ew', padx=(8,5), ipady=4)
-        add_goal_btn = tk.Button(form_frame, text="Add Goal", font=FONTS['BUTTON'], 
-                                bg=COLORS['GREEN'], fg=COLORS['BLACK'], command=self.add_saving_goal,
-                                relief='flat', bd=2, padx=15, pady=6)
-        add_goal_btn.grid(row=2, column=0, columnspan=3, sticky='ew', padx=8, pady=(6,8))
-        delete_goal_btn = tk.Button(form_frame, text="Delete Selected", font=FONTS['BUTTON'], 
-                                   bg=COLORS['RED'], fg=COLORS['WHITE'], command=self.delete_saving_goal,
-                                   relief='flat', bd=2, padx=15, pady=6)
-        delete_goal_btn.grid(row=3, column=0, columnspan=3, sticky='ew', padx=8, pady=(6,8))
+        if getattr(self, '_goals_built', False):
+            return
+        self._build_crud_tab(FORM_SPECS['saving_goals'], self.add_saving_goal, self.delete_saving_goal)
+        self._goals_built = True
+        self.refresh_saving_goals_list()
     def setup_budgets_tab(self):
         """Setup budgets management tab"""
-        budgets_frame = tk.Frame(self.notebook, bg=COLORS['FRAME_BG'])
-        self.notebook.add(budgets_frame, text='Budgets')
-        budgets_frame.grid_rowconfigure(1, weight=1)
-        budgets_frame.grid_columnconfigure(0, weight=1)
-        # Header
-        header_label = tk.Label(budgets_frame, text="Budgets", font=FONTS['HEADER'], 
-                               fg=COLORS['GREY'], bg=COLORS['FRAME_BG'])
-        header_label.grid(row=0, column=0, pady=15, sticky='w', padx=20)
-        # Budgets list
-        self.budgets_list_frame = tk.Frame(budgets_frame, bg=COLORS['FRAME_BG'], relief='flat', bd=2)
-        self.budgets_list_frame.grid(row=1, column=0, sticky='nsew', padx=20, pady=10)
-        self.budgets_list_frame.grid_columnconfigure(0, weight=1)
-        # Add budget form
-        form_frame = tk.Frame(budgets_frame, bg=COLORS['FRAME_BG'], relief='flat', bd=2)
-        form_frame.grid(row=2, column=0, sticky='ew', padx=20, pady=15)
-        form_frame.grid_columnconfigure((0,1,2), weight=1)
-        tk.Label(form_frame, text="Category:", font=FONTS['FORM_LABEL'], 
-                fg=COLORS['GREY'], bg=COLORS['FRAME_BG']).grid(row=0, column=0, sticky='w', pady=4, padx=8)
-        self.budget_category_combo = ttk.Combobox(form_frame, state="readonly")
-        self.budget_category_combo.grid(row=1, column=0, sticky='ew', padx=(8,5), ipady=4)
-        tk.Label(form_frame, text="Budget Amount:", font=FONTS['FORM_LABEL'], 
-                fg=COLORS['GREY'], bg=COLORS['FRAME_BG']).grid(row=0, column=1, sticky='w', pady=4, padx=8)
-        self.budget_amount_var = tk.StringVar()
-        tk.Entry(form_frame, textvariable=self.budget_amount_var, font=FONTS['FORM_LABEL'],
-                bg=COLORS['WHITE'], fg=COLORS['BLACK'], relief='flat', bd=1).grid(row=1, column=1, sticky='ew', padx=(8,5), ipady=4)
-        tk.Label(form_frame, text="Time Period:", font=FONTS['FORM_LABEL'], 
-                fg=COLORS['GREY'], bg=COLORS['FRAME_BG']).grid(row=0, column=2, sticky='w', pady=4, padx=8)
-        self.time_combo = ttk.Combobox(form_frame, values=["Week", "Month", "Year"], state="readonly")
-        self.time_combo.set("Month")  # Default to Month
-        self.time_combo.grid(row=1, column=2, sticky='ew', padx=(8,5), ipady=4)
-        add_budget_btn = tk.Button(form_frame, text="Add Budget", font=FONTS['BUTTON'], 
-                                  bg=COLORS['GREEN'], fg=COLORS['BLACK'], command=self.add_budget,
-                                  relief='flat', bd=2, padx=15, pady=6)
-        add_budget_btn.grid(row=2, column=0, columnspan=3, sticky='ew', padx=8, pady=(6,8))
-        delete_budget_btn = tk.Button(form_frame, text="Delete Selected", font=FONTS['BUTTON'], 
-                                     bg=COLORS['RED'], fg=COLORS['WHITE'], command=self.delete_budget,
-                                     relief='flat', bd=2, padx=15, pady=6)
-        delete_budget_btn.grid(row=3, column=0, columnspan=3, sticky='ew', padx=8, pady=(6,8))
+        if getattr(self, '_budgets_built', False):
+            return
+        self._build_crud_tab(FORM_SPECS['budgets'], self.add_budget, self.delete_budget)
+        self._budgets_built = True
+        self.refresh_budgets_list()
+        self.update_budget_category_combo()
     def setup_reports_tab(self):
         """Setup reports tab"""
+        if getattr(self, '_reports_built', False):
+            return
         reports_frame = tk.Frame(self.notebook, bg=COLORS['FRAME_BG'])
         self.notebook.add(reports_frame, text='Reports')
         reports_frame.grid_rowconfigure(1, weight=1)
@@ -2023,6 +2266,7 @@ class MainApp:
         header_label.grid(row=0, column=0, pady=15, sticky='w', padx=20)
         # Reports content
         self.setup_reports_content(reports_frame)
+        self._reports_built = True
     def setup_reports_content(self, parent_frame):
         """Setup reports content"""
         # Main container with left panel for controls and right panel for preview
@@ -2079,16 +2323,20 @@ class MainApp:
         filter_label = tk.Label(controls_frame, text="Include Accounts:", font=FONTS['FORM_LABEL'], 
                                fg=COLORS['GREY'], bg=COLORS['FRAME_BG'])
         filter_label.grid(row=6, column=0, sticky='w', padx=15, pady=(0,5))
-        self.include_savings_var = tk.BooleanVar(value=True)
+        self.include_savings_var = tk.IntVar(value=1)
         savings_check = tk.Checkbutton(controls_frame, text="Savings Accounts", variable=self.include_savings_var,
                                       font=FONTS['FORM_LABEL'], fg=COLORS['GREY'], bg=COLORS['FRAME_BG'],
                                       activebackground=COLORS['FRAME_BG'], selectcolor=COLORS['WHITE'])
         savings_check.grid(row=7, column=0, sticky='w', padx=15, pady=(0,5))
-        self.include_regular_var = tk.BooleanVar(value=True)
+        self.include_regular_var = tk.IntVar(value=1)
         regular_check = tk.Checkbutton(controls_frame, text="Regular Accounts", variable=self.include_regular_var,
                                       font=FONTS['FORM_LABEL'], fg=COLORS['GREY'], bg=COLORS['FRAME_BG'],
                                       activebackground=COLORS['FRAME_BG'], selectcolor=COLORS['WHITE'])
         regular_check.grid(row=8, column=0, sticky='w', padx=15, pady=(0,15))
+        # Mirror the checkboxes in Python so generate_report never reads back from Tk
+        self._inc_sav = self._inc_reg = True
+        self.include_savings_var.trace_add("write", self._on_account_filter_change)
+        self.include_regular_var.trace_add("write", self._on_account_filter_change)
         # Generate button
         generate_btn = tk.Button(controls_frame, text="Generate Report", font=FONTS['BUTTON'], 
                                 bg=COLORS['GREEN'], fg=COLORS['BLACK'], command=self.generate_report,
@@ -2135,14 +2383,18 @@ class MainApp:
             start_date = end_date - timedelta(days=365)
         elif range_type == "Custom Range":
             try:
-                start_date = datetime.strptime(self.from_date_var.get(), "%Y-%m-%d")
-                end_date = datetime.strptime(self.to_date_var.get(), "%Y-%m-%d")
+                start_date = parse_day(self.from_date_var.get())
+                end_date = parse_day(self.to_date_var.get())
             except ValueError:
                 messagebox.showerror("Error", "Invalid date format. Use YYYY-MM-DD")
                 return None, None
         else:
             start_date = end_date - timedelta(days=30)
         return start_date, end_date
+    def _on_account_filter_change(self, *args):
+        """Cache the account type checkboxes whenever they change"""
+        self._inc_sav = bool(self.include_savings_var.get())
+        self._inc_reg = bool(self.include_regular_var.get())
     def generate_report(self):
         """Generate and save report"""
         try:
@@ -2154,12 +2406,17 @@ class MainApp:
                 return
             # Get report type
             report_type = self.report_type_var.get()
-            # Get filtered accounts
-            accounts_to_include = []
-            if self.include_regular_var.get():
-                accounts_to_include.extend([acc for acc in self.accounts if acc.account_type != "Savings"])
-            if self.include_savings_var.get():
-                accounts_to_include.extend([acc for acc in self.accounts if acc.account_type == "Savings"])
+            # Get filtered accounts from the lists split at refresh time
+            inc_reg = self._inc_reg
+            inc_sav = self._inc_sav
+            if inc_reg and inc_sav:
+                accounts_to_include = self.accounts
+            elif inc_reg:
+                accounts_to_include = self._regular_accounts
+            elif inc_sav:
+                accounts_to_include = self._savings_accounts
+            else:
+                accounts_to_include = []
             if not accounts_to_include:
                 messagebox.showerror("Error", "Please select at least one account type to include")
                 self.status_label.config(text="Ready to generate report")
@@ -2175,6 +2432,12 @@ class MainApp:
             self.status_label.config(text="Error generating report")
     def get_report_data(self, start_date, end_date, accounts):
         """Get comprehensive report data for the given period"""
+        key = (self.user.user_id, start_date.date(), end_date.date(),
+               frozenset(account.account_id for account in accounts))
+        cached = self._report_cache.get(key)
+        if cached is not None:
+            self._report_cache.move_to_end(key)
+            return cached
         try:
             # Get accounts info
             accounts_data = {}
@@ -2185,57 +2448,118 @@ class MainApp:
                     'balance': account.balance
                 }
             
-            # Get transactions
-            placeholders = ','.join(['?'] * len(accounts))
-            account_ids = [account.account_id for account in accounts]
+            # Get transactions; the account set is bound as one JSON array so the
+            # SQL text is identical whatever the number of accounts
+            account_ids = json.dumps([account.account_id for account in accounts])
+            period_filter = """
+                WHERE t.UserID = ? AND t.AccountID IN (SELECT value FROM json_each(?))
+                AND t.Date_Created >= ? AND t.Date_Created < ?
+            """
+            # Format the period once; the preview and PDF reuse these strings
+            start_str = start_date.strftime('%Y-%m-%d')
+            end_str = end_date.strftime('%Y-%m-%d')
+            # Half-open range on the raw ISO text so the index can be used
+            params = [self.user.user_id, account_ids, start_str, (end_date + timedelta(days=1)).strftime('%Y-%m-%d')]
             query = f"""
                 SELECT t.*, a.Name as AccountName, c.Name as CategoryName
                 FROM Transactions t
                 JOIN Account a ON t.AccountID = a.AccountID
                 LEFT JOIN Category c ON t.CategoryID = c.CategoryID
-                WHERE t.UserID = ? AND t.AccountID IN ({placeholders})
-                AND DATE(t.Date_Created) BETWEEN ? AND ?
+                {period_filter}
                 ORDER BY t.Date_Created DESC
             """
-            rows = self.database.execute_query(query, [self.user.user_id] + account_ids + [start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d')], fetch_all=True)
+            # sqlite3.Row already supports the t['Amount'] style lookups used downstream
+            recent_transactions = self.database.execute_query(
+                query + " LIMIT ?", params + [REPORT_CONFIG['RECENT_LIMIT']], fetch_all=True)
             
-            transactions = []
-            for row in rows:
-                transaction_dict = {
-                    'Transaction_ID': row['TransactionID'],
-                    'User_ID': row['UserID'],
-                    'Account_ID': row['AccountID'],
-                    'Category_ID': row['CategoryID'],
-                    'Amount': row['Amount'],
-                    'Description': row['Description'],
-                    'TransactionType': row['TransactionType'],
-                    'To_Account_ID': row['ToAccountID'],
-                    'Date_Created': row['Date_Created'],
-                    'AccountName': row['AccountName'],
-                    'CategoryName': row['CategoryName']
-                }
-                transactions.append(transaction_dict)
+            # Let SQLite do the summing; each result set is then walked once
+            # One pivoted row per category, so no Python-side regrouping is needed
+            category_rows = self.database.execute_query(f"""
+                SELECT c.Name as CategoryName,
+                       COALESCE(SUM(CASE WHEN t.TransactionType = 'Income' THEN t.Amount END), 0.0) as Income,
+                       COALESCE(SUM(CASE WHEN t.TransactionType = 'Expense' THEN t.Amount END), 0.0) as Expense
+                FROM Transactions t
+                JOIN Category c ON t.CategoryID = c.CategoryID
+                {period_filter}
+                GROUP BY c.Name
+            """, params, fetch_all=True)
+            category_totals = {}
+            expense_by_category = {}
+            for row in category_rows:
+                category_totals[row['CategoryName']] = {'Income': row['Income'], 'Expense': row['Expense']}
+                if row['Expense']:
+                    expense_by_category[row['CategoryName']] = row['Expense']
+            # Per-day totals for the trend chart; transfer-only days still appear.
+            # Summing the days gives the per-type totals without another query
+            daily_rows = self.database.execute_query(f"""
+                SELECT substr(t.Date_Created, 1, 10) as Day,
+                       COALESCE(SUM(CASE WHEN t.TransactionType = 'Income' THEN t.Amount END), 0.0) as Income,
+                       COALESCE(SUM(CASE WHEN t.TransactionType = 'Expense' THEN t.Amount END), 0.0) as Expense,
+                       COALESCE(SUM(CASE WHEN t.TransactionType = 'Transfer' THEN t.Amount END), 0.0) as Transfer
+                FROM Transactions t
+                {period_filter}
+                GROUP BY Day
+                ORDER BY Day
+            """, params, fetch_all=True)
+            daily_totals = {}
+            total_income = total_expense = total_transfer = 0.0
+            for row in daily_rows:
+                income, expense = row['Income'], row['Expense']
+                daily_totals[row['Day']] = {'Income': income, 'Expense': expense}
+                total_income += income
+                total_expense += expense
+                total_transfer += row['Transfer']
+            totals_by_type = {'Income': total_income, 'Expense': total_expense, 'Transfer': total_transfer}
+            # Volume per account, most recently active first
+            account_rows = self.database.execute_query(f"""
+                SELECT a.Name as AccountName, SUM(t.Amount) as Total
+                FROM Transactions t
+                JOIN Account a ON t.AccountID = a.AccountID
+                {period_filter}
+                GROUP BY a.Name
+                ORDER BY MAX(t.Date_Created) DESC
+            """, params, fetch_all=True)
+            account_activity = {row['AccountName']: row['Total'] for row in account_rows}
             
             # Get budgets with spending for the period
             budgets = self.database.get_user_budgets_with_spending(self.user.user_id)
             # Get savings goals
             saving_goals = self.database.get_user_saving_goals(self.user.user_id)
             
-            return {
+            report_data = {
                 'start_date': start_date,
                 'end_date': end_date,
+                'start_str': start_str,
+                'end_str': end_str,
                 'user_name': self.user.name,
                 'accounts': accounts_data,
-                'transactions': transactions,
+                'recent_transactions': recent_transactions,
+                'totals_by_type': totals_by_type,
+                'category_totals': category_totals,
+                'expense_by_category': expense_by_category,
+                'daily_totals': daily_totals,
+                'account_activity': account_activity,
                 'budgets': budgets,
                 'saving_goals': saving_goals
             }
         except Exception as e:
             messagebox.showerror("Error", f"Failed to generate report data: {e}")
             return None
+        self._report_cache[key] = report_data
+        if len(self._report_cache) > 8:
+            self._report_cache.popitem(last=False)
+        return report_data
     def create_report_preview(self, report_data, report_type):
         """Create comprehensive report preview for all report types"""
-        # Clear existing preview
+        # Cached report_data objects are replaced whenever data changes, so the same
+        # object and type means the preview on screen is already up to date
+        if (self._last_preview is not None and self._last_preview[0] is report_data
+                and self._last_preview[1] == report_type and self.preview_area.winfo_children()):
+            return
+        self._last_preview = (report_data, report_type)
+        self._pending_charts = []
+        # Clear existing preview (and the wheel handler pointing at its canvas)
+        self.preview_area.unbind_all("<MouseWheel>")
         for widget in self.preview_area.winfo_children():
             widget.destroy()
         # Create scrollable frame for report content
@@ -2246,8 +2570,12 @@ class MainApp:
             "<Configure>",
             lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
         )
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+        def on_view_change(first, last):
+            scrollbar.set(first, last)
+            # Charts are drawn only once they scroll into view
+            self._build_visible_charts()
+        canvas.configure(yscrollcommand=on_view_change)
+        self._preview_canvas = canvas
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
         # Report header
@@ -2256,7 +2584,7 @@ class MainApp:
         title_label = tk.Label(header_frame, text=f"{report_type}", 
                               font=FONTS['HEADER'], fg=COLORS['BLACK'], bg=COLORS['WHITE'])
         title_label.pack(anchor='w')
-        period_text = f"Period: {report_data['start_date'].strftime('%Y-%m-%d')} to {report_data['end_date'].strftime('%Y-%m-%d')}"
+        period_text = f"Period: {report_data['start_str']} to {report_data['end_str']}"
         period_label = tk.Label(header_frame, text=period_text, 
                                font=FONTS['LIST_ITEM'], fg=COLORS['GREY'], bg=COLORS['WHITE'])
         period_label.pack(anchor='w')
@@ -2271,12 +2599,51 @@ class MainApp:
             self._create_budget_analysis_preview(scrollable_frame, report_data)
         elif report_type == "Complete Financial Report":
             self._create_complete_financial_preview(scrollable_frame, report_data)
-        # Enable mouse wheel scrolling
+        # Attach the content only once every section is packed, so Tk lays it out in one pass
+        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+        # Enable mouse wheel scrolling while the pointer is over the preview
         def _on_mousewheel(event):
             canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        canvas.bind_all("<MouseWheel>", _on_mousewheel)
+        canvas.bind("<Enter>", lambda e: canvas.bind_all("<MouseWheel>", _on_mousewheel))
+        def _on_leave(event):
+            # Moving onto the embedded report frame also sends <Leave> (NotifyInferior),
+            # but the pointer is still inside the canvas; tkinter exposes no detail field
+            if not (0 <= event.x < canvas.winfo_width() and 0 <= event.y < canvas.winfo_height()):
+                canvas.unbind_all("<MouseWheel>")
+        canvas.bind("<Leave>", _on_leave)
+    # TableStyle objects shared by every PDF, built on first use
+    _PDF_TABLE_STYLES = {}
+    def _pdf_table_style(self, align_from, header_size, body_size=None):
+        """Get the shared grey-header table style for PDF tables"""
+        key = (align_from, header_size, body_size)
+        style = self._PDF_TABLE_STYLES.get(key)
+        if style is None:
+            from reportlab.lib import colors
+            from reportlab.platypus import TableStyle
+            commands = [
+                ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+                ('ALIGN', (align_from, 0), (-1, -1), 'CENTER'),
+                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                ('FONTSIZE', (0, 0), (-1, 0), header_size),
+            ]
+            if body_size:
+                commands.append(('FONTSIZE', (0, 1), (-1, -1), body_size))
+            commands += [
+                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+                ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+                ('GRID', (0, 0), (-1, -1), 1, colors.black)
+            ]
+            style = self._PDF_TABLE_STYLES[key] = TableStyle(commands)
+        return style
     def create_pdf_report(self, report_data, report_type, pdf_path):
         """Create PDF report using reportlab"""
+        from reportlab.lib import colors
+        from reportlab.lib.enums import TA_CENTER
+        from reportlab.lib.pagesizes import letter
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.lib.units import inch
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table
         try:
             doc = SimpleDocTemplate(pdf_path, pagesize=letter)
             story = []
@@ -2301,15 +2668,15 @@ class MainApp:
             story.append(Paragraph(title_text, title_style))
             story.append(Spacer(1, 20))
             # Report info
-            date_range = f"Period: {report_data['start_date'].strftime('%Y-%m-%d')} to {report_data['end_date'].strftime('%Y-%m-%d')}"
+            date_range = f"Period: {report_data['start_str']} to {report_data['end_str']}"
             story.append(Paragraph(f"User: {report_data['user_name']}", styles['Normal']))
             story.append(Paragraph(date_range, styles['Normal']))
             story.append(Paragraph(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}", styles['Normal']))
             story.append(Spacer(1, 20))
             # Summary section
             story.append(Paragraph("Executive Summary", heading_style))
-            total_income = sum(float(t['Amount']) for t in report_data['transactions'] if t['TransactionType'] == 'Income')
-            total_expenses = sum(float(t['Amount']) for t in report_data['transactions'] if t['TransactionType'] == 'Expense')
+            total_income = report_data['totals_by_type'].get('Income', 0.0)
+            total_expenses = report_data['totals_by_type'].get('Expense', 0.0)
             net_cashflow = total_income - total_expenses
             summary_data = [
                 ['Metric', 'Amount (BDT)'],
@@ -2318,29 +2685,12 @@ class MainApp:
                 ['Net Cashflow', f'{net_cashflow:.2f}']
             ]
             summary_table = Table(summary_data, colWidths=[3*inch, 2*inch])
-            summary_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 12),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black)
-            ]))
+            summary_table.setStyle(self._pdf_table_style(0, 12))
             story.append(summary_table)
             story.append(Spacer(1, 20))
             # Category breakdown
             story.append(Paragraph("Category Analysis", heading_style))
-            category_totals = {}
-            for transaction in report_data['transactions']:
-                if transaction['CategoryName']:
-                    category = transaction['CategoryName']
-                    amount = float(transaction['Amount'])
-                    trans_type = transaction['TransactionType']
-                    if category not in category_totals:
-                        category_totals[category] = {'Income': 0, 'Expense': 0}
-                    category_totals[category][trans_type] += amount
+            category_totals = report_data['category_totals']
             if category_totals:
                 category_data = [['Category', 'Income (BDT)', 'Expenses (BDT)', 'Net (BDT)']]
                 for category, amounts in category_totals.items():
@@ -2352,16 +2702,7 @@ class MainApp:
                         f"{net:.2f}"
                     ])
                 category_table = Table(category_data, colWidths=[2*inch, 1.5*inch, 1.5*inch, 1.5*inch])
-                category_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                    ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('FONTSIZE', (0, 0), (-1, 0), 11),
-                    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.black)
-                ]))
+                category_table.setStyle(self._pdf_table_style(1, 11))
                 story.append(category_table)
             else:
                 story.append(Paragraph("No categorized transactions found.", styles['Normal']))
@@ -2376,21 +2717,12 @@ class MainApp:
                     f"{account_info['balance']:.2f}"
                 ])
             account_table = Table(account_data, colWidths=[3*inch, 1.5*inch, 2*inch])
-            account_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 11),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black)
-            ]))
+            account_table.setStyle(self._pdf_table_style(1, 11))
             story.append(account_table)
             story.append(Spacer(1, 20))
             # Recent transactions (last 10)
             story.append(Paragraph("Recent Transactions", heading_style))
-            recent_transactions = report_data['transactions'][:10]  # Already sorted by date DESC
+            recent_transactions = report_data['recent_transactions']  # Already sorted by date DESC
             if recent_transactions:
                 trans_data = [['Date', 'Description', 'Category', 'Amount (BDT)', 'Type']]
                 for trans in recent_transactions:
@@ -2408,102 +2740,231 @@ class MainApp:
                         trans['TransactionType']
                     ])
                 trans_table = Table(trans_data, colWidths=[1*inch, 2*inch, 1.5*inch, 1*inch, 1*inch])
-                trans_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                    ('ALIGN', (2, 0), (-1, -1), 'CENTER'),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('FONTSIZE', (0, 0), (-1, 0), 10),
-                    ('FONTSIZE', (0, 1), (-1, -1), 9),
-                    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.black)
-                ]))
+                trans_table.setStyle(self._pdf_table_style(2, 10, 9))
                 story.append(trans_table)
             else:
                 story.append(Paragraph("No transactions found in the selected period.", styles['Normal']))
             # Create charts and add to PDF
-            self.add_charts_to_pdf(story, report_data, report_type)
+            self.add_charts_to_pdf(story, report_data, report_type, total_income, total_expenses)
             # Build PDF
             doc.build(story)
         except Exception as e:
             raise
-    def add_charts_to_pdf(self, story, report_data, report_type):
+    def add_charts_to_pdf(self, story, report_data, report_type, income, expenses):
         """Add charts to PDF report"""
         try:
-            # Create temporary directory for chart images
-            temp_dir = tempfile.mkdtemp()
-            # Income vs Expenses chart
-            fig, ax = plt.subplots(figsize=(8, 5))
-            income = sum(float(t['Amount']) for t in report_data['transactions'] if t['TransactionType'] == 'Income')
-            expenses = sum(float(t['Amount']) for t in report_data['transactions'] if t['TransactionType'] == 'Expense')
-            categories = ['Income', 'Expenses']
-            amounts = [income, expenses]
-            colors_list = ['#00FF7F', '#FF6B6B']
-            bars = ax.bar(categories, amounts, color=colors_list, alpha=0.8)
-            ax.set_title('Income vs Expenses Comparison', fontsize=14, fontweight='bold')
-            ax.set_ylabel('Amount (BDT)', fontsize=12)
-            # Add value labels on bars
-            for bar, amount in zip(bars, amounts):
-                height = bar.get_height()
-                ax.text(bar.get_x() + bar.get_width()/2., height,
-                       f'{amount:.2f}', ha='center', va='bottom', fontsize=11)
+            # Drawn on the render worker, so switching rcParams never overlaps a preview render
+            self._render_executor.submit(self._draw_pdf_charts, story, report_data, income, expenses).result()
+        except Exception as e:
+            # Continue without charts if there's an error
+            pass
+    def _draw_pdf_charts(self, story, report_data, income, expenses):
+        """Draw the PDF charts into story; runs on the render worker"""
+        import matplotlib
+        # PDF charts use matplotlib's defaults, not the preview's simplification settings
+        with matplotlib.rc_context({key: matplotlib.rcParamsDefault[key] for key in PREVIEW_RC_PARAMS}):
+            self._draw_pdf_charts_with_defaults(story, report_data, income, expenses)
+    def _draw_pdf_charts_with_defaults(self, story, report_data, income, expenses):
+        """Draw the Income vs Expenses and category charts into story"""
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+        from reportlab.lib.styles import getSampleStyleSheet
+        from reportlab.lib.units import inch
+        from reportlab.platypus import Image, Paragraph, Spacer
+        # One off-screen figure is reused for every PDF chart
+        fig = getattr(self, '_chart_fig', None)
+        if fig is None:
+            fig = self._chart_fig = Figure(facecolor='white')
+            FigureCanvasAgg(fig)
+        # Income vs Expenses chart
+        fig.clear()
+        fig.set_size_inches(8, 5)
+        ax = fig.add_subplot(111)
+        categories = ['Income', 'Expenses']
+        amounts = [income, expenses]
+        colors_list = ['#00FF7F', '#FF6B6B']
+        bars = ax.bar(categories, amounts, color=colors_list, alpha=0.8)
+        ax.set_title('Income vs Expenses Comparison', fontsize=14, fontweight='bold')
+        ax.set_ylabel('Amount (BDT)', fontsize=12)
+        # Add value labels on bars
+        for bar, amount in zip(bars, amounts):
+            height = bar.get_height()
+            ax.text(bar.get_x() + bar.get_width()/2., height,
+                   f'{amount:.2f}', ha='center', va='bottom', fontsize=11)
+        # Save chart
+        chart1 = io.BytesIO()
+        fig.savefig(chart1, format='png', dpi=150, bbox_inches='tight', facecolor='white')
+        chart1.seek(0)
+        # Add chart to PDF
+        story.append(Spacer(1, 20))
+        story.append(Paragraph("Income vs Expenses Analysis", getSampleStyleSheet()['Heading2']))
+        story.append(Spacer(1, 10))
+        story.append(Image(chart1, width=6*inch, height=3.75*inch))
+        # Category pie chart if there are expenses
+        category_totals = report_data['expense_by_category']
+        if category_totals:
+            fig.clear()
+            fig.set_size_inches(8, 6)
+            ax = fig.add_subplot(111)
+            categories, amounts = zip(*category_totals.items())
+            # Create pie chart
+            wedges, texts, autotexts = ax.pie(amounts, labels=categories, autopct='%1.1f%%', 
+                                             startangle=90, textprops={'fontsize': 10})
+            ax.set_title('Expense Distribution by Category', fontsize=14, fontweight='bold')
             # Save chart
-            chart1_path = os.path.join(temp_dir, 'income_vs_expenses.png')
-            plt.savefig(chart1_path, dpi=150, bbox_inches='tight', facecolor='white')
-            plt.close()
+            chart2 = io.BytesIO()
+            fig.savefig(chart2, format='png', dpi=150, bbox_inches='tight', facecolor='white')
+            chart2.seek(0)
             # Add chart to PDF
             story.append(Spacer(1, 20))
-            story.append(Paragraph("Income vs Expenses Analysis", getSampleStyleSheet()['Heading2']))
+            story.append(Paragraph("Expense Breakdown by Category", getSampleStyleSheet()['Heading2']))
             story.append(Spacer(1, 10))
-            story.append(Image(chart1_path, width=6*inch, height=3.75*inch))
-            # Category pie chart if there are expenses
-            category_totals = {}
-            for transaction in report_data['transactions']:
-                if transaction['TransactionType'] == 'Expense' and transaction['CategoryName']:
-                    category = transaction['CategoryName']
-                    amount = float(transaction['Amount'])
-                    category_totals[category] = category_totals.get(category, 0) + amount
-            if category_totals:
-                fig, ax = plt.subplots(figsize=(8, 6))
-                categories = list(category_totals.keys())
-                amounts = list(category_totals.values())
-                # Create pie chart
-                wedges, texts, autotexts = ax.pie(amounts, labels=categories, autopct='%1.1f%%', 
-                                                 startangle=90, textprops={'fontsize': 10})
-                ax.set_title('Expense Distribution by Category', fontsize=14, fontweight='bold')
-                # Save chart
-                chart2_path = os.path.join(temp_dir, 'category_breakdown.png')
-                plt.savefig(chart2_path, dpi=150, bbox_inches='tight', facecolor='white')
-                plt.close()
-                # Add chart to PDF
-                story.append(Spacer(1, 20))
-                story.append(Paragraph("Expense Breakdown by Category", getSampleStyleSheet()['Heading2']))
-                story.append(Spacer(1, 10))
-                story.append(Image(chart2_path, width=6*inch, height=4.5*inch))
-            # Clean up temporary files
-            try:
-                import shutil
-                shutil.rmtree(temp_dir)
-            except:
-                pass  # Ignore cleanup errors
-        except Exception as e:
-            # Continue without charts if there's an error
-            pass
+            story.append(Image(chart2, width=6*inch, height=4.5*inch))
     
+    def _run_in_background(self, func, args, on_done):
+        """Run func(*args) on the database worker and pass its future to on_done"""
+        future = self._db_executor.submit(func, *args)
+        self._poll_future(future, on_done)
+    def _run_write(self, func, args, on_success=None, failure_message=None):
+        """Queue a database write; writes queued together commit as one transaction"""
+        self._pending_writes.append((func, args, on_success, failure_message))
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self._after(50, self._flush_writes)
+    def _flush_writes(self):
+        """Send every queued write to the worker, then report errors or refresh once"""
+        self._flush_scheduled = False
+        batch = list(self._pending_writes)
+        self._pending_writes.clear()
+        future = self._db_executor.submit(self._apply_writes, batch)
+        self._write_futures[future] = batch
+        def on_done(future):
+            if self._write_futures.pop(future, None) is not None:
+                self._report_writes(batch, self._write_failures(batch, future.result))
+        self._poll_future(future, on_done)
+    def _apply_writes(self, batch):
+        """Apply a batch in one transaction, each write in its own savepoint; return the failures"""
+        failures = {}
+        with self.database.get_connection():
+            for index, (func, args, _, _) in enumerate(batch):
+                try:
+                    with self.database.savepoint():
+                        func(*args)
+                except Exception as e:
+                    # Only this write is rolled back; the rest of the batch still commits
+                    failures[index] = e
+        return failures
+    def _write_failures(self, batch, apply):
+        """Call apply() for a batch's failures; if the batch itself fails, every write failed"""
+        try:
+            return apply()
+        except Exception as e:
+            # e.g. the outer COMMIT failed, so nothing in the batch was saved
+            return {index: e for index in range(len(batch))}
+    def _report_writes(self, batch, failures, refresh=True):
+        """Run on_success for the writes that committed and show one error per failed write"""
+        for index, (_, _, on_success, failure_message) in enumerate(batch):
+            error = failures.get(index)
+            if error is None:
+                if on_success:
+                    on_success()
+            elif isinstance(error, ValidationError):
+                messagebox.showerror("Validation Error", str(error))
+            elif isinstance(error, DatabaseError):
+                messagebox.showerror("Database Error", str(error))
+            else:
+                messagebox.showerror("Error", f"{failure_message or 'Failed to save changes'}: {error}")
+        if refresh and len(failures) < len(batch):
+            self._schedule_refresh()
+    def _after(self, delay, func, *args):
+        """Schedule func(*args) after delay ms (None for idle) and track it for close()"""
+        def callback():
+            self._after_ids.discard(after_id)
+            func(*args)
+        if delay is None:
+            after_id = self.parent.after_idle(callback)
+        else:
+            after_id = self.parent.after(delay, callback)
+        self._after_ids.add(after_id)
+    def _poll_future(self, future, on_done):
+        """Wait for a worker future from the Tk thread without blocking it"""
+        if not self.notebook.winfo_exists():
+            return
+        if future.done():
+            on_done(future)
+        else:
+            self._after(10, self._poll_future, future, on_done)
+    def _drain_writes(self):
+        """Apply every queued write now and report the outcome, without refreshing"""
+        # Batches already on the worker go first so writes keep their order
+        in_flight, self._write_futures = self._write_futures, {}
+        for future, batch in in_flight.items():
+            self._report_writes(batch, self._write_failures(batch, future.result), refresh=False)
+        self._flush_scheduled = False
+        batch = list(self._pending_writes)
+        self._pending_writes.clear()
+        if batch:
+            self._report_writes(batch, self._write_failures(batch, lambda: self._apply_writes(batch)),
+                                refresh=False)
+    def close(self):
+        """Save queued writes, then release the database and chart render worker threads"""
+        # Logout and exit cancel the flush timer, so anything still queued is written here
+        try:
+            self._drain_writes()
+        finally:
+            # Queued reads and renders are dropped, and the running one is waited for, so
+            # nothing touches the shared connection after Database.close()
+            for executor in (self._db_executor, self._render_executor):
+                if sys.version_info >= (3, 9):
+                    executor.shutdown(wait=True, cancel_futures=True)
+                else:
+                    executor.shutdown(wait=True)
+            # Cancel only this screen's timers; Tk's own after() callbacks are left alone
+            for after_id in self._after_ids:
+                self.parent.after_cancel(after_id)
+            self._after_ids.clear()
+    def _schedule_refresh(self):
+        """Coalesce refresh requests from rapid writes into one refresh_data call"""
+        # Data changed, so cached reports are stale even before the refresh runs
+        self._report_cache.clear()
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        self._after(50, self._do_refresh)
+    def _do_refresh(self):
+        """Run the pending refresh"""
+        self._refresh_pending = False
+        self.refresh_data()
     def refresh_data(self):
         """Refresh all data from database"""
+        self._report_cache.clear()
         # Sync saving goals with account balances first
         try:
             self.database.sync_all_saving_goals(self.user.user_id)
         except Exception as e:
             print(f"Warning: Could not sync saving goals: {e}")
         
+        # Drop expired budgets now and then; the budget query already hides them
+        now = time.monotonic()
+        if self._last_cleanup_ts is None or now - self._last_cleanup_ts > BUDGET_CONFIG['CLEANUP_INTERVAL']:
+            self._last_cleanup_ts = now
+            self._after(None, self.database.cleanup_expired_budgets, self.user.user_id)
         # Get updated data
-        self.accounts = self.database.get_user_accounts(self.user.user_id)
-        self.categories = self.database.get_user_categories(self.user.user_id)
-        self.saving_goals = self.database.get_user_saving_goals(self.user.user_id)
-        self.budgets = self.database.get_user_budgets_with_spending(self.user.user_id)
+        bundle = self.database.get_user_dashboard_bundle(self.user.user_id)
+        self.accounts = bundle['accounts']
+        self.categories = bundle['categories']
+        self.saving_goals = bundle['saving_goals']
+        self.budgets = bundle['budgets']
+        # Name lookups used by the transaction list instead of a JOIN per fetch
+        self._account_name_by_id = {a.account_id: a.name for a in self.accounts}
+        self._category_name_by_id = {c.category_id: c.name for c in self.categories}
+        self._categories_by_type = {}
+        for category in self.categories:
+            self._categories_by_type.setdefault(category.category_type, []).append(category)
+        self._savings_accounts = []
+        self._regular_accounts = []
+        for account in self.accounts:
+            (self._savings_accounts if account.account_type == AccountType.SAVINGS else self._regular_accounts).append(account)
         
         # Check for completed goals and show celebrations
         try:
@@ -2516,55 +2977,77 @@ class MainApp:
         except Exception as e:
             print(f"Warning: Could not check completed goals: {e}")
         # Get balance summary
-        summary = self.database.get_user_balance_summary(self.user.user_id)
+        income, expense, balance, cashflow = bundle['summary']
         # Update balance display
-        self.balance_label.config(text=f"{summary['total_balance']:.2f} BDT")
-        self.income_value_label.config(text=f"{summary['monthly_income']:.2f} BDT")
-        self.expense_value_label.config(text=f"{summary['monthly_expense']:.2f} BDT")
-        self.cashflow_label.config(text=f"{summary['monthly_cashflow']:.2f} BDT")
-        # Refresh lists
+        self.balance_label.config(text=format_bdt(balance))
+        self.income_value_label.config(text=format_bdt(income))
+        self.expense_value_label.config(text=format_bdt(expense))
+        self.cashflow_label.config(text=format_bdt(cashflow))
+        # Refresh lists (tabs that are not built yet refresh themselves once built)
         self.refresh_accounts_list()
-        self.refresh_categories_list()
-        self.refresh_saving_goals_list()
-        self.refresh_budgets_list()
+        if getattr(self, '_cat_built', False):
+            self.refresh_categories_list()
+        if getattr(self, '_goals_built', False):
+            self.refresh_saving_goals_list()
+        if getattr(self, '_budgets_built', False):
+            self.refresh_budgets_list()
+        self._tx_cache_version += 1
+        self._tx_page_cache.clear()
         self.display_transactions()
-        # Update budget category dropdown with expense categories
-        expense_categories = [c for c in self.categories if c.category_type == "Expense"]
-        category_names = [cat.name for cat in expense_categories]
-        if hasattr(self, 'budget_category_combo'):
-            self.budget_category_combo['values'] = category_names
+        self.update_budget_category_combo()
         # Refresh saving goals and budgets
         self.refresh_saving_goals()
         self.refresh_budgets()
+    def update_budget_category_combo(self):
+        """Update budget category dropdown with expense categories"""
+        if not hasattr(self, 'budget_category_combo'):
+            return
+        expense_categories = self._categories_by_type.get(CategoryType.EXPENSE, [])
+        category_names = tuple(c.name for c in expense_categories)
+        # IDs parallel to the combobox values, so a selection index maps straight to a category
+        self._expense_category_ids = tuple(c.category_id for c in expense_categories)
+        # Only touch the widget when the list actually changed
+        if category_names != self._last_budget_cat_sig:
+            self.budget_category_combo['values'] = category_names
+            self._last_budget_cat_sig = category_names
     def refresh_accounts_list(self):
         """Refresh accounts list display"""
         for widget in self.accounts_list_frame.winfo_children():
             widget.destroy()
+        self._account_buttons = []
+        # Resolve the theme entries once rather than per row
+        green, grey, black, list_font = COLORS['GREEN'], COLORS['GREY'], COLORS['BLACK'], FONTS['LIST_ITEM']
         for i, account in enumerate(self.accounts):
-            color = COLORS['GREEN'] if i == self.selected_account_index else COLORS['GREY']
+            color = green if i == self.selected_account_index else grey
             account_btn = tk.Button(self.accounts_list_frame, 
                                    text=f"{account.name}\n{account.balance:.2f} BDT • {account.account_type}", 
-                                   font=FONTS['LIST_ITEM'], bg=color, fg=COLORS['BLACK'],
+                                   font=list_font, bg=color, fg=black,
                                    relief='flat', bd=2, pady=10, anchor='w', justify='left',
                                    command=lambda idx=i: self.select_account(idx))
             account_btn.grid(row=i, column=0, sticky='ew', pady=2, padx=4)
+            self._account_buttons.append((account_btn, grey))
     def refresh_categories_list(self):
         """Refresh categories list display"""
         for widget in self.categories_list_frame.winfo_children():
             widget.destroy()
+        self._category_buttons = []
+        green, grey, black, light_green = COLORS['GREEN'], COLORS['GREY'], COLORS['BLACK'], COLORS['LIGHT_GREEN']
+        list_font = FONTS['LIST_ITEM']
         for i, category in enumerate(self.categories):
-            color = COLORS['GREEN'] if i == self.selected_category_index else (
-                COLORS['GREY'] if category.category_type == "Expense" else COLORS['LIGHT_GREEN'])
+            base_color = grey if category.category_type == CategoryType.EXPENSE else light_green
+            color = green if i == self.selected_category_index else base_color
             category_btn = tk.Button(self.categories_list_frame, 
                                     text=f"{category.name} ({category.category_type})", 
-                                    font=FONTS['LIST_ITEM'], bg=color, fg=COLORS['BLACK'],
+                                    font=list_font, bg=color, fg=black,
                                     relief='flat', bd=2, pady=8, anchor='w',
                                     command=lambda idx=i: self.select_category(idx))
             category_btn.grid(row=i, column=0, sticky='ew', pady=2, padx=4)
+            self._category_buttons.append((category_btn, base_color))
     def refresh_saving_goals_list(self):
         """Refresh saving goals list display"""
         for widget in self.saving_goals_list_frame.winfo_children():
             widget.destroy()
+        self._saving_goal_buttons = []
         if not self.saving_goals:
             no_goals_label = tk.Label(self.saving_goals_list_frame, 
                                      text="No saving goals yet.\nCreate one using the form below!", 
@@ -2572,8 +3055,9 @@ class MainApp:
                                      justify='center')
             no_goals_label.grid(row=0, column=0, sticky='ew', pady=20, padx=4)
             return
+        green, grey, black, list_font = COLORS['GREEN'], COLORS['GREY'], COLORS['BLACK'], FONTS['LIST_ITEM']
         for i, goal in enumerate(self.saving_goals):
-            color = COLORS['GREEN'] if i == self.selected_saving_goal_index else COLORS['GREY']
+            color = green if i == self.selected_saving_goal_index else grey
             # Create goal display text
             if goal.is_default:
                 goal_text = f"{goal.goal_name}\nCurrent: {goal.current_amount:.2f} BDT"
@@ -2582,50 +3066,52 @@ class MainApp:
                 goal_text = f"{goal.goal_name}\n{goal.current_amount:.2f} / {goal.target_amount:.2f} BDT ({progress_pct:.1f}%)"
             goal_btn = tk.Button(self.saving_goals_list_frame, 
                                 text=goal_text,
-                                font=FONTS['LIST_ITEM'], bg=color, fg=COLORS['BLACK'],
+                                font=list_font, bg=color, fg=black,
                                 relief='flat', bd=2, pady=10, anchor='w', justify='left',
                                 command=lambda idx=i: self.select_saving_goal(idx))
             goal_btn.grid(row=i, column=0, sticky='ew', pady=2, padx=4)
+            self._saving_goal_buttons.append((goal_btn, grey))
     def refresh_budgets_list(self):
         """Refresh budgets list display"""
         for widget in self.budgets_list_frame.winfo_children():
             widget.destroy()
+        self._budget_buttons = []
+        green, grey, black, red = COLORS['GREEN'], COLORS['GREY'], COLORS['BLACK'], COLORS['RED']
+        list_font = FONTS['LIST_ITEM']
         for i, budget in enumerate(self.budgets):
-            color = COLORS['GREEN'] if i == self.selected_budget_index else (
-                COLORS['RED'] if budget['is_over_threshold'] else COLORS['GREY'])
+            base_color = red if budget['is_over_threshold'] else grey
+            color = green if i == self.selected_budget_index else base_color
             budget_text = f"{budget['category_name']} - {budget['time_period']}\n{budget['spent_amount']:.2f} / {budget['budget_amount']:.2f} BDT"
             budget_btn = tk.Button(self.budgets_list_frame, 
                                   text=budget_text,
-                                  font=FONTS['LIST_ITEM'], bg=color, fg=COLORS['BLACK'],
+                                  font=list_font, bg=color, fg=black,
                                   relief='flat', bd=2, pady=10, anchor='w', justify='left',
                                   command=lambda idx=i: self.select_budget(idx))
             budget_btn.grid(row=i, column=0, sticky='ew', pady=2, padx=4)
-    def get_category_total_spent(self, category_id):
-        """Get total amount spent in a category"""
-        try:
-            result = self.database.execute_query("""
-                SELECT SUM(Amount) as total FROM Transactions 
-                WHERE CategoryID = ? AND TransactionType = 'Expense'
-            """, [category_id], fetch_one=True)
-            return result['total'] or 0.0
-        except Exception:
-            return 0.0
+            self._budget_buttons.append((budget_btn, base_color))
+    def _move_selection(self, buttons, old_index, new_index):
+        """Recolour the previously and newly selected list buttons"""
+        if 0 <= old_index < len(buttons):
+            button, base_color = buttons[old_index]
+            button.config(bg=base_color)
+        if 0 <= new_index < len(buttons):
+            buttons[new_index][0].config(bg=COLORS['GREEN'])
     def select_account(self, index):
         """Select an account"""
+        self._move_selection(self._account_buttons, self.selected_account_index, index)
         self.selected_account_index = index
-        self.refresh_accounts_list()
     def select_category(self, index):
         """Select a category"""
+        self._move_selection(self._category_buttons, self.selected_category_index, index)
         self.selected_category_index = index
-        self.refresh_categories_list()
     def select_saving_goal(self, index):
         """Select a saving goal"""
+        self._move_selection(self._saving_goal_buttons, self.selected_saving_goal_index, index)
         self.selected_saving_goal_index = index
-        self.refresh_saving_goals_list()
     def select_budget(self, index):
         """Select a budget"""
+        self._move_selection(self._budget_buttons, self.selected_budget_index, index)
         self.selected_budget_index = index
-        self.refresh_budgets_list()
     def add_account(self):
         """Add a new account"""
         name = self.account_name_var.get().strip()
@@ -2633,16 +3119,11 @@ class MainApp:
         if not name or not account_type:
             messagebox.showerror("Error", "Please fill all fields")
             return
-        try:
-            account = Account(user_id=self.user.user_id, name=name, account_type=account_type)
-            self.database.create_account(account)
+        account = Account(user_id=self.user.user_id, name=name, account_type=account_type)
+        def clear_form():
             self.account_name_var.set("")
             self.account_type_combo.set("")
-            self.refresh_data()
-        except ValidationError as e:
-            messagebox.showerror("Validation Error", str(e))
-        except DatabaseError as e:
-            messagebox.showerror("Database Error", str(e))
+        self._run_write(self.database.create_account, (account,), clear_form)
     def delete_account(self):
         """Delete selected account"""
         if self.selected_account_index == -1:
@@ -2650,12 +3131,10 @@ class MainApp:
             return
         account = self.accounts[self.selected_account_index]
         if messagebox.askyesno("Confirm Delete", f"Delete account '{account.name}'?"):
-            try:
-                self.database.delete_account(account.account_id, self.user.user_id)
+            def clear_selection():
                 self.selected_account_index = -1
-                self.refresh_data()
-            except DatabaseError as e:
-                messagebox.showerror("Database Error", str(e))
+            self._run_write(self.database.delete_account, (account.account_id, self.user.user_id),
+                            clear_selection)
     def add_category(self):
         """Add a new category"""
         name = self.category_name_var.get().strip()
@@ -2663,16 +3142,11 @@ class MainApp:
         if not name or not category_type:
             messagebox.showerror("Error", "Please fill all fields")
             return
-        try:
-            category = Category(user_id=self.user.user_id, name=name, category_type=category_type)
-            self.database.create_category(category)
+        category = Category(user_id=self.user.user_id, name=name, category_type=category_type)
+        def clear_form():
             self.category_name_var.set("")
             self.category_type_combo.set("")
-            self.refresh_data()
-        except ValidationError as e:
-            messagebox.showerror("Validation Error", str(e))
-        except DatabaseError as e:
-            messagebox.showerror("Database Error", str(e))
+        self._run_write(self.database.create_category, (category,), clear_form)
     def delete_category(self):
         """Delete selected category"""
         if self.selected_category_index == -1:
@@ -2680,32 +3154,32 @@ class MainApp:
             return
         category = self.categories[self.selected_category_index]
         if messagebox.askyesno("Confirm Delete", f"Delete category '{category.name}'?"):
-            try:
-                self.database.delete_category(category.category_id, self.user.user_id)
+            def clear_selection():
                 self.selected_category_index = -1
-                self.refresh_data()
-            except DatabaseError as e:
-                messagebox.showerror("Database Error", str(e))
+            self._run_write(self.database.delete_category, (category.category_id, self.user.user_id),
+                            clear_selection)
     def open_income_popup(self):
         """Open income popup"""
         if not self.accounts:
             messagebox.showerror("Error", "Please add at least one account first")
             return
-        IncomePopup(self.parent, self.database, self.user, self.accounts, self.categories, self.refresh_data)
+        IncomePopup(self.parent, self.database, self.user, self.accounts,
+                    self._categories_by_type.get(CategoryType.INCOME, []), self._schedule_refresh)
     def open_expense_popup(self):
         """Open expense popup"""
         # Filter out savings accounts for expense transactions
-        non_savings_accounts = [acc for acc in self.accounts if acc.account_type != "Savings"]
+        non_savings_accounts = self._regular_accounts
         if not non_savings_accounts:
             messagebox.showerror("Error", "Please add at least one non-savings account first")
             return
-        ExpensePopup(self.parent, self.database, self.user, non_savings_accounts, self.categories, self.refresh_data)
+        ExpensePopup(self.parent, self.database, self.user, non_savings_accounts,
+                     self._categories_by_type.get(CategoryType.EXPENSE, []), self._schedule_refresh)
     def open_transfer_popup(self):
         """Open transfer popup"""
         if len(self.accounts) < 2:
             messagebox.showerror("Error", "Please add at least two accounts first")
             return
-        TransferPopup(self.parent, self.database, self.user, self.accounts, self.refresh_data)
+        TransferPopup(self.parent, self.database, self.user, self.accounts, self._schedule_refresh)
     def setup_saving_goals_tracker(self, parent_frame):
         """Setup saving goals tracker in top right quadrant"""
         parent_frame.grid_rowconfigure(0, weight=1)  # Goals list
@@ -2720,18 +3194,27 @@ class MainApp:
         self.goals_current_page = 0
         self.goals_items_per_page = 3
         self.goals_total_pages = 1
+        # One reusable row per visible goal; refreshes only reconfigure them
+        self._goal_row_widgets = [self._make_goal_row(i) for i in range(self.goals_items_per_page)]
+        self._no_goals_label = tk.Label(self.goals_list_frame, 
+                                        text="No saving goals yet.\nClick 'Add Saving Goal' to start!", 
+                                        font=cached_font('inter', 11, 'normal'), fg=COLORS['GREY'], bg=COLORS['FRAME_BG'],
+                                        justify='center')
+        # Placed once and hidden; grid() later restores these options
+        self._no_goals_label.grid(row=0, column=0, sticky='ew', pady=20, padx=4)
+        self._no_goals_label.grid_remove()
         # Pagination controls for goals
         goals_pagination_frame = tk.Frame(parent_frame, bg=COLORS['FRAME_BG'], relief='flat', bd=1)
         goals_pagination_frame.grid(row=1, column=0, sticky="ew", padx=8, pady=(0,4))
         goals_pagination_frame.grid_columnconfigure(1, weight=1)
-        self.goals_prev_btn = tk.Button(goals_pagination_frame, text="Previous", font=('inter', 10, 'normal'), 
+        self.goals_prev_btn = tk.Button(goals_pagination_frame, text="Previous", font=cached_font('inter', 10, 'normal'), 
                                        bg=COLORS['GREY'], fg=COLORS['BLACK'], command=self.prev_goals_page, 
                                        relief='flat', bd=1, padx=12, pady=4)
         self.goals_prev_btn.grid(row=0, column=0, padx=6, pady=4)
         self.goals_page_label = tk.Label(goals_pagination_frame, text="Page 1 of 1", 
-                                        font=('inter', 10, 'normal'), fg=COLORS['GREY'], bg=COLORS['FRAME_BG'])
+                                        font=cached_font('inter', 10, 'normal'), fg=COLORS['GREY'], bg=COLORS['FRAME_BG'])
         self.goals_page_label.grid(row=0, column=1, pady=4)
-        self.goals_next_btn = tk.Button(goals_pagination_frame, text="Next", font=('inter', 10, 'normal'), 
+        self.goals_next_btn = tk.Button(goals_pagination_frame, text="Next", font=cached_font('inter', 10, 'normal'), 
                                        bg=COLORS['GREY'], fg=COLORS['BLACK'], command=self.next_goals_page, 
                                        relief='flat', bd=1, padx=12, pady=4)
         self.goals_next_btn.grid(row=0, column=2, padx=6, pady=4)
@@ -2772,18 +3255,26 @@ class MainApp:
         self.budgets_current_page = 0
         self.budgets_items_per_page = 5
         self.budgets_total_pages = 1
+        # One reusable row of four cells per visible budget
+        self._budget_row_widgets = [self._make_budget_row(i) for i in range(self.budgets_items_per_page)]
+        self._no_budgets_label = tk.Label(self.budget_list_frame, 
+                                          text="No budgets yet.\nClick 'Add Budget' to start!", 
+                                          font=cached_font('inter', 11, 'normal'), fg=COLORS['GREY'], bg=COLORS['FRAME_BG'],
+                                          justify='center')
+        self._no_budgets_label.grid(row=0, column=0, columnspan=4, sticky='ew', pady=20, padx=4)
+        self._no_budgets_label.grid_remove()
         # Pagination controls for budgets
         budgets_pagination_frame = tk.Frame(parent_frame, bg=COLORS['FRAME_BG'], relief='flat', bd=1)
         budgets_pagination_frame.grid(row=2, column=0, sticky="ew", padx=8, pady=(2,4))
         budgets_pagination_frame.grid_columnconfigure(1, weight=1)
-        self.budgets_prev_btn = tk.Button(budgets_pagination_frame, text="Previous", font=('inter', 10, 'normal'), 
+        self.budgets_prev_btn = tk.Button(budgets_pagination_frame, text="Previous", font=cached_font('inter', 10, 'normal'), 
                                          bg=COLORS['GREY'], fg=COLORS['BLACK'], command=self.prev_budgets_page, 
                                          relief='flat', bd=1, padx=12, pady=4)
         self.budgets_prev_btn.grid(row=0, column=0, padx=6, pady=4)
         self.budgets_page_label = tk.Label(budgets_pagination_frame, text="Page 1 of 1", 
-                                          font=('inter', 10, 'normal'), fg=COLORS['GREY'], bg=COLORS['FRAME_BG'])
+                                          font=cached_font('inter', 10, 'normal'), fg=COLORS['GREY'], bg=COLORS['FRAME_BG'])
         self.budgets_page_label.grid(row=0, column=1, pady=4)
-        self.budgets_next_btn = tk.Button(budgets_pagination_frame, text="Next", font=('inter', 10, 'normal'), 
+        self.budgets_next_btn = tk.Button(budgets_pagination_frame, text="Next", font=cached_font('inter', 10, 'normal'), 
                                          bg=COLORS['GREY'], fg=COLORS['BLACK'], command=self.next_budgets_page, 
                                          relief='flat', bd=1, padx=12, pady=4)
         self.budgets_next_btn.grid(row=0, column=2, padx=6, pady=4)
@@ -2793,26 +3284,62 @@ class MainApp:
                                   fg=COLORS['BLACK'], command=self.open_budget_popup,
                                   relief='flat', bd=2, pady=6)
         add_budget_btn.grid(row=3, column=0, sticky='ew', padx=8, pady=(0,8))
+    def _make_goal_row(self, row):
+        """Build one hidden goal row for the dashboard tracker"""
+        goal_frame = tk.Frame(self.goals_list_frame, bg=COLORS['GREY'], relief='flat', bd=2)
+        goal_frame.grid(row=row, column=0, sticky='ew', pady=3, padx=4)
+        goal_frame.grid_columnconfigure(0, weight=1)
+        # Goal name and progress
+        name_var = tk.StringVar(goal_frame)
+        name_label = tk.Label(goal_frame, textvariable=name_var,
+                              font=cached_font('inter', 12, 'bold'), fg=COLORS['BLACK'], bg=COLORS['GREY'])
+        name_label.grid(row=0, column=0, sticky='w', padx=8, pady=(6,0))
+        # Progress bar: one canvas rectangle resized with coords()
+        progress_canvas = tk.Canvas(goal_frame, height=8, bg=COLORS['FRAME_BG'], highlightthickness=0)
+        progress_canvas.grid(row=1, column=0, sticky='ew', padx=8, pady=2)
+        progress_rect = progress_canvas.create_rectangle(1, 1, 1, 7, fill=COLORS['GREEN'], outline='')
+        amount_var = tk.StringVar(goal_frame)
+        amount_label = tk.Label(goal_frame, textvariable=amount_var,
+                                font=cached_font('inter', 10, 'normal'), fg=COLORS['BLACK'], bg=COLORS['GREY'])
+        amount_label.grid(row=2, column=0, sticky='w', padx=8, pady=(0,6))
+        goal_frame.grid_remove()
+        goal_row = {'frame': goal_frame, 'name_var': name_var, 'progress_canvas': progress_canvas,
+                    'progress_rect': progress_rect, 'progress_pct': 0.0, 'amount_var': amount_var}
+        # Redraw the fill when the canvas gets its real width
+        progress_canvas.bind('<Configure>', lambda event: self._draw_goal_progress(goal_row, event.width))
+        progress_canvas.grid_remove()
+        return goal_row
+    def _draw_goal_progress(self, goal_row, width=None):
+        """Size a goal row's progress rectangle to its stored percentage"""
+        if width is None:
+            width = goal_row['progress_canvas'].winfo_width()
+        fill_width = int((width - 2) * goal_row['progress_pct'] / 100)
+        goal_row['progress_canvas'].coords(goal_row['progress_rect'], 1, 1, 1 + max(fill_width, 0), 7)
+    def _make_budget_row(self, row):
+        """Build one hidden row of budget cells for the dashboard tracker"""
+        cells = []
+        for column in range(4):
+            cell_var = tk.StringVar(self.budget_list_frame)
+            cell = tk.Label(self.budget_list_frame, textvariable=cell_var, font=cached_font('inter', 10, 'normal'),
+                            fg=COLORS['GREY'], bg=COLORS['FRAME_BG'])
+            cell.grid(row=row, column=column, sticky='ew', padx=1, pady=1, ipady=3)
+            cell.grid_remove()
+            cells.append((cell, cell_var))
+        return cells
     def refresh_saving_goals(self):
         """Refresh saving goals display with pagination"""
-        # Clear existing goals
-        for widget in self.goals_list_frame.winfo_children():
-            widget.destroy()
-        # Get all saving goals
-        all_goals = self.database.get_user_saving_goals(self.user.user_id)
+        # Page through the goals refresh_data already loaded instead of re-querying
+        all_goals = self.saving_goals
         if not all_goals:
-            no_goals_label = tk.Label(self.goals_list_frame, 
-                                     text="No saving goals yet.\nClick 'Add Saving Goal' to start!", 
-                                     font=('inter', 11, 'normal'), fg=COLORS['GREY'], bg=COLORS['FRAME_BG'],
-                                     justify='center')
-            no_goals_label.grid(row=0, column=0, sticky='ew', pady=20, padx=4)
+            for row in self._goal_row_widgets:
+                row['frame'].grid_remove()
+            self._no_goals_label.grid()
             # Update pagination
             self.goals_total_pages = 1
             self.goals_current_page = 0
-            self.goals_prev_btn.config(state="disabled")
-            self.goals_next_btn.config(state="disabled")
-            self.goals_page_label.config(text="Page 1 of 1")
+            self._update_page_controls("goals")
             return
+        self._no_goals_label.grid_remove()
         # Calculate pagination
         self.goals_total_pages = max(1, (len(all_goals) + self.goals_items_per_page - 1) // self.goals_items_per_page)
         # Ensure current page is within bounds
@@ -2821,169 +3348,182 @@ class MainApp:
         start_idx = self.goals_current_page * self.goals_items_per_page
         end_idx = min(start_idx + self.goals_items_per_page, len(all_goals))
         page_goals = all_goals[start_idx:end_idx]
-        for i, goal in enumerate(page_goals):
-            goal_frame = tk.Frame(self.goals_list_frame, bg=COLORS['GREY'], relief='flat', bd=2)
-            goal_frame.grid(row=i, column=0, sticky='ew', pady=3, padx=4)
-            goal_frame.grid_columnconfigure(0, weight=1)
-            # Goal name and progress
-            name_label = tk.Label(goal_frame, text=goal.goal_name, 
-                                 font=('inter', 12, 'bold'), fg=COLORS['BLACK'], bg=COLORS['GREY'])
-            name_label.grid(row=0, column=0, sticky='w', padx=8, pady=(6,0))
+        for i, row in enumerate(self._goal_row_widgets):
+            if i >= len(page_goals):
+                row['frame'].grid_remove()
+                continue
+            goal = page_goals[i]
+            row['name_var'].set(goal.goal_name)
             # Progress info
             if goal.is_default:
                 # Default goal - no progress bar
-                amount_text = f"{goal.current_amount:.2f} BDT"
+                amount_text = "%.2f BDT" % goal.current_amount
+                row['progress_canvas'].grid_remove()
             else:
                 progress_pct = goal.progress_percentage()
-                amount_text = f"{goal.current_amount:.2f} / {goal.target_amount:.2f} BDT"
+                amount_text = "%.2f / %.2f BDT" % (goal.current_amount, goal.target_amount)
                 # Progress bar - only show if target amount > 0
                 if goal.target_amount > 0:
-                    progress_frame = tk.Frame(goal_frame, bg=COLORS['GREY'])
-                    progress_frame.grid(row=1, column=0, sticky='ew', padx=8, pady=2)
-                    progress_frame.grid_columnconfigure(0, weight=1)
-                    progress_bg = tk.Frame(progress_frame, bg=COLORS['FRAME_BG'], height=8, relief='flat', bd=1)
-                    progress_bg.grid(row=0, column=0, sticky='ew')
-                    if progress_pct > 0:
-                        # Ensure progress doesn't exceed 100%
-                        display_pct = min(progress_pct, 100.0)
-                        progress_fill = tk.Frame(progress_bg, bg=COLORS['GREEN'], height=6)
-                        progress_fill.place(x=1, y=1, relwidth=display_pct/100, relheight=0.75)
-            amount_label = tk.Label(goal_frame, text=amount_text, 
-                                   font=('inter', 10, 'normal'), fg=COLORS['BLACK'], bg=COLORS['GREY'])
-            amount_label.grid(row=2, column=0, sticky='w', padx=8, pady=(0,6))
-            # Check if goal is completed
-            if not goal.is_default and goal.is_completed():
-                self.show_goal_completion_celebration(goal)
+                    row['progress_canvas'].grid()
+                    # Ensure progress doesn't exceed 100%
+                    row['progress_pct'] = min(max(progress_pct, 0.0), 100.0)
+                    self._draw_goal_progress(row)
+                else:
+                    row['progress_canvas'].grid_remove()
+                # Check if goal is completed
+                if goal.is_completed():
+                    self.show_goal_completion_celebration(goal)
+            row['amount_var'].set(amount_text)
+            row['frame'].grid()
         # Update pagination buttons
-        self.goals_prev_btn.config(state="normal" if self.goals_current_page > 0 else "disabled")
-        self.goals_next_btn.config(state="normal" if self.goals_current_page < self.goals_total_pages - 1 else "disabled")
-        self.goals_page_label.config(text=f"Page {self.goals_current_page + 1} of {self.goals_total_pages}")
+        self._update_page_controls("goals")
     def refresh_budgets(self):
         """Refresh budget tracker display with pagination"""
-        # Clear existing budgets
-        for widget in self.budget_list_frame.winfo_children():
-            widget.destroy()
-        # Clean up expired budgets first
-        self.database.cleanup_expired_budgets(self.user.user_id)
-        # Get all budgets with spending
-        all_budgets = self.database.get_user_budgets_with_spending(self.user.user_id)
+        # Page through the budgets refresh_data already loaded instead of re-querying
+        all_budgets = self.budgets
         if not all_budgets:
-            no_budgets_label = tk.Label(self.budget_list_frame, 
-                                       text="No budgets yet.\nClick 'Add Budget' to start!", 
-                                       font=('inter', 11, 'normal'), fg=COLORS['GREY'], bg=COLORS['FRAME_BG'],
-                                       justify='center')
-            no_budgets_label.grid(row=0, column=0, columnspan=4, sticky='ew', pady=20, padx=4)
+            for cells in self._budget_row_widgets:
+                for cell, _ in cells:
+                    cell.grid_remove()
+            self._no_budgets_label.grid()
             # Update pagination
             self.budgets_total_pages = 1
             self.budgets_current_page = 0
-            self.budgets_prev_btn.config(state="disabled")
-            self.budgets_next_btn.config(state="disabled")
-            self.budgets_page_label.config(text="Page 1 of 1")
+            self._update_page_controls("budgets")
             return
+        self._no_budgets_label.grid_remove()
         # Calculate pagination
         self.budgets_total_pages = max(1, (len(all_budgets) + self.budgets_items_per_page - 1) // self.budgets_items_per_page)
         start_idx = self.budgets_current_page * self.budgets_items_per_page
         end_idx = min(start_idx + self.budgets_items_per_page, len(all_budgets))
         page_budgets = all_budgets[start_idx:end_idx]
-        for i, budget in enumerate(page_budgets):
-            # Determine text color based on spending threshold
-            text_color = COLORS['GREY']
-            row_bg = COLORS['FRAME_BG']
-            # Create budget row
-            tk.Label(self.budget_list_frame, text=budget['category_name'], 
-                    font=('inter', 10, 'normal'), fg=text_color, bg=row_bg).grid(
-                    row=i, column=0, sticky='ew', padx=1, pady=1, ipady=3)
-            tk.Label(self.budget_list_frame, text=f"{budget['budget_amount']:.2f}", 
-                    font=('inter', 10, 'normal'), fg=text_color, bg=row_bg).grid(
-                    row=i, column=1, sticky='ew', padx=1, pady=1, ipady=3)
+        text_color = COLORS['GREY']
+        for i, cells in enumerate(self._budget_row_widgets):
+            if i >= len(page_budgets):
+                for cell, _ in cells:
+                    cell.grid_remove()
+                continue
+            budget = page_budgets[i]
             # Remaining amount - red if over threshold
             remaining_color = COLORS['RED'] if budget['is_over_threshold'] else text_color
-            tk.Label(self.budget_list_frame, text=f"{budget['remaining_amount']:.2f}", 
-                    font=('inter', 10, 'normal'), fg=remaining_color, bg=row_bg).grid(
-                    row=i, column=2, sticky='ew', padx=1, pady=1, ipady=3)
-            tk.Label(self.budget_list_frame, text=f"{budget['spent_amount']:.2f}", 
-                    font=('inter', 10, 'normal'), fg=text_color, bg=row_bg).grid(
-                    row=i, column=3, sticky='ew', padx=1, pady=1, ipady=3)
+            texts = (budget['category_name'], _fmt2(budget['budget_amount']),
+                     _fmt2(budget['remaining_amount']), _fmt2(budget['spent_amount']))
+            for (_, cell_var), cell_text in zip(cells, texts):
+                cell_var.set(cell_text)
+            cells[2][0].config(fg=remaining_color)
+            for cell, _ in cells:
+                cell.grid()
         # Update pagination buttons
-        self.budgets_prev_btn.config(state="normal" if self.budgets_current_page > 0 else "disabled")
-        self.budgets_next_btn.config(state="normal" if self.budgets_current_page < self.budgets_total_pages - 1 else "disabled")
-        self.budgets_page_label.config(text=f"Page {self.budgets_current_page + 1} of {self.budgets_total_pages}")
+        self._update_page_controls("budgets")
+    def _update_page_controls(self, page_type):
+        """Update a dashboard pager's buttons and label, skipping unchanged options"""
+        current = getattr(self, f"{page_type}_current_page")
+        total = getattr(self, f"{page_type}_total_pages")
+        state = ("normal" if current > 0 else "disabled",
+                 "normal" if current < total - 1 else "disabled",
+                 f"Page {current + 1} of {total}")
+        last = self._page_controls_state.get(page_type, (None, None, None))
+        widgets = (getattr(self, f"{page_type}_prev_btn"), getattr(self, f"{page_type}_next_btn"),
+                   getattr(self, f"{page_type}_page_label"))
+        for widget, option, new, old in zip(widgets, ('state', 'state', 'text'), state, last):
+            if new != old:
+                widget.config(**{option: new})
+        self._page_controls_state[page_type] = state
     def show_goal_completion_celebration(self, goal):
         """Show celebration popup for completed goal"""
         # Check if we've already shown celebration for this goal
-        if hasattr(self, '_celebrated_goals') and goal.goal_id in self._celebrated_goals:
+        if goal.goal_id in self._celebrated_goals:
             return
-        # Mark this goal as celebrated
-        if not hasattr(self, '_celebrated_goals'):
-            self._celebrated_goals = set()
-        self._celebrated_goals.add(goal.goal_id)
+        # Remember it for this session so refreshes don't queue it twice; it is only
+        # recorded in the database once its popup is actually shown
+        self._celebrated_goals = self._celebrated_goals | {goal.goal_id}
+        # Goals completed together are celebrated one after another
+        self._celebration_queue.append(goal)
+        if self._celebration_goal is None:
+            self._show_next_celebration()
+    def _build_celebration_popup(self):
+        """Build the celebration popup once; later celebrations reuse it"""
         celebration_popup = tk.Toplevel(self.parent)
+        celebration_popup.withdraw()
         celebration_popup.title("🎉 Goal Completed! 🎉")
-        celebration_popup.geometry("500x300")
         celebration_popup.configure(bg=COLORS['GREEN'])
-        celebration_popup.grab_set()
         celebration_popup.transient(self.parent)
+        celebration_popup.protocol("WM_DELETE_WINDOW", lambda: self._dismiss_celebration(celebration_popup))
         # Center the popup
-        celebration_popup.update_idletasks()
         x = (celebration_popup.winfo_screenwidth() // 2) - (250)
         y = (celebration_popup.winfo_screenheight() // 2) - (150)
         celebration_popup.geometry(f"500x300+{x}+{y}")
         # Celebration content
-        celebration_label = tk.Label(celebration_popup, 
-                                    text=f"🎉🎊 CONGRATULATIONS! 🎊🎉\n\nYou've completed your goal:\n'{goal.goal_name}'\n\nAmount achieved: {goal.current_amount:.2f} BDT", 
-                                    font=('inter', 16, 'bold'), fg=COLORS['BLACK'], bg=COLORS['GREEN'],
-                                    justify='center')
-        celebration_label.pack(expand=True, pady=20)
+        self._celebration_label = tk.Label(celebration_popup, 
+                                           font=cached_font('inter', 16, 'bold'), fg=COLORS['BLACK'], bg=COLORS['GREEN'],
+                                           justify='center')
+        self._celebration_label.pack(expand=True, pady=20)
         # Options frame
         options_frame = tk.Frame(celebration_popup, bg=COLORS['GREEN'])
         options_frame.pack(pady=20)
         # Keep as normal account button
         keep_btn = tk.Button(options_frame, text="Keep as Normal Account", 
-                            font=('inter', 12, 'bold'), bg=COLORS['WHITE'], fg=COLORS['BLACK'],
-                            command=lambda: self.convert_to_normal_account(goal, celebration_popup),
+                            font=cached_font('inter', 12, 'bold'), bg=COLORS['WHITE'], fg=COLORS['BLACK'],
+                            command=lambda: self.convert_to_normal_account(self._celebration_goal, celebration_popup),
                             padx=20, pady=10)
         keep_btn.pack(side='left', padx=10)
         # Close button (keep as savings goal)
         close_btn = tk.Button(options_frame, text="Keep as Savings Goal", 
-                             font=('inter', 12, 'bold'), bg=COLORS['GREY'], fg=COLORS['BLACK'],
-                             command=celebration_popup.destroy,
+                             font=cached_font('inter', 12, 'bold'), bg=COLORS['GREY'], fg=COLORS['BLACK'],
+                             command=lambda: self._dismiss_celebration(celebration_popup),
                              padx=20, pady=10)
         close_btn.pack(side='right', padx=10)
+        self._celebration_popup = celebration_popup
+    def _show_next_celebration(self):
+        """Fill the shared popup with the next queued goal and show it"""
+        if not self._celebration_queue:
+            return
+        if self._celebration_popup is None:
+            self._build_celebration_popup()
+        goal = self._celebration_goal = self._celebration_queue.pop(0)
+        self.database.mark_goal_celebrated(self.user.user_id, goal.goal_id)
+        self._celebration_label.config(
+            text=f"🎉🎊 CONGRATULATIONS! 🎊🎉\n\nYou've completed your goal:\n'{goal.goal_name}'\n\nAmount achieved: {goal.current_amount:.2f} BDT")
+        self._celebration_popup.deiconify()
+        self._celebration_popup.grab_set()
+    def _dismiss_celebration(self, popup):
+        """Hide the shared celebration popup (or destroy any other popup)"""
+        if popup is not self._celebration_popup:
+            popup.destroy()
+            return
+        popup.grab_release()
+        popup.withdraw()
+        self._celebration_goal = None
+        self._show_next_celebration()
     def convert_to_normal_account(self, goal, popup):
         """Convert saving account to normal bank account"""
         try:
-            # Update the account type to Bank
-            self.database.execute_query("""
-                UPDATE Account SET AccountType = 'Bank', Name = ? 
-                WHERE AccountID = ?
-            """, [f"{goal.goal_name} Account", goal.account_id])
-            
-            # Delete the saving goal
-            self.database.execute_query("DELETE FROM SavingGoal WHERE GoalID = ?", [goal.goal_id])
-            
-            popup.destroy()
+            self.database.convert_saving_goal_account(goal.goal_id, goal.account_id,
+                                                      f"{goal.goal_name} Account")
+            self._dismiss_celebration(popup)
             messagebox.showinfo("Success", f"'{goal.goal_name}' converted to a normal bank account!")
-            self.refresh_data()
+            self._schedule_refresh()
         except DatabaseError as e:
             messagebox.showerror("Error", str(e))
     def delete_completed_goal(self, goal, popup):
         """Delete completed saving goal and account"""
         try:
             self.database.delete_saving_goal(goal.goal_id, self.user.user_id)
-            popup.destroy()
+            self._dismiss_celebration(popup)
             messagebox.showinfo("Success", "Saving goal and account deleted!")
-            self.refresh_data()
+            self._schedule_refresh()
         except DatabaseError as e:
             messagebox.showerror("Error", str(e))
     def open_saving_goal_popup(self):
         """Open saving goal creation popup"""
-        SavingGoalPopup(self.parent, self.database, self.user, self.refresh_data)
+        SavingGoalPopup(self.parent, self.database, self.user, self._schedule_refresh)
     def open_budget_popup(self):
         """Open budget creation popup"""
-        if not self.categories:
+        expense_categories = self._categories_by_type.get(CategoryType.EXPENSE, [])
+        if not expense_categories:
             messagebox.showerror("Error", "Please add expense categories first")
             return
-        BudgetPopup(self.parent, self.database, self.user, self.categories, self.refresh_data)
+        BudgetPopup(self.parent, self.database, self.user, expense_categories, self._schedule_refresh)
     def navigate_page(self, page_type, direction):
         """Generic method to navigate pages"""
         if page_type == "goals":
@@ -3041,21 +3581,17 @@ class MainApp:
                 target_amount=target_amount,
                 current_amount=current_amount
             )
-            self.database.create_saving_goal(goal)
+        except ValueError:
+            messagebox.showerror("Error", "Please enter valid amounts")
+            return
+        def on_created():
             # Clear form
             self.goal_name_var.set("")
             self.target_amount_var.set("")
             self.current_saving_var.set("")
             messagebox.showinfo("Success", f"Saving goal '{goal_name}' created successfully!")
-            self.refresh_data()
-        except ValueError:
-            messagebox.showerror("Error", "Please enter valid amounts")
-        except ValidationError as e:
-            messagebox.showerror("Validation Error", str(e))
-        except DatabaseError as e:
-            messagebox.showerror("Database Error", str(e))
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to create saving goal: {e}")
+        self._run_write(self.database.create_saving_goal, (goal,), on_created,
+                        failure_message="Failed to create saving goal")
     def delete_saving_goal(self):
         """Delete selected saving goal"""
         if self.selected_saving_goal_index == -1:
@@ -3063,12 +3599,10 @@ class MainApp:
             return
         goal = self.saving_goals[self.selected_saving_goal_index]
         if messagebox.askyesno("Confirm Delete", f"Delete saving goal '{goal.goal_name}'?"):
-            try:
-                self.database.delete_saving_goal(goal.goal_id, self.user.user_id)
+            def clear_selection():
                 self.selected_saving_goal_index = -1
-                self.refresh_data()
-            except DatabaseError as e:
-                messagebox.showerror("Database Error", str(e))
+            self._run_write(self.database.delete_saving_goal, (goal.goal_id, self.user.user_id),
+                            clear_selection)
     def add_budget(self):
         """Add a new budget"""
         category_index = self.budget_category_combo.current()
@@ -3085,30 +3619,25 @@ class MainApp:
             return
         try:
             budget_amount = float(budget_amount_str)
-            # Get expense categories for the budget
-            expense_categories = [c for c in self.categories if c.category_type == "Expense"]
-            if category_index >= len(expense_categories):
+            # Map the combobox index to the expense category it was built from
+            if category_index >= len(self._expense_category_ids):
                 messagebox.showerror("Error", "Invalid category selection")
                 return
-            category = expense_categories[category_index]
             # Create budget
             budget = Budget(
                 user_id=self.user.user_id,
-                category_id=category.category_id,
+                category_id=self._expense_category_ids[category_index],
                 budget_amount=budget_amount,
                 time_period=time_period
             )
-            self.database.create_budget(budget)
+        except ValueError:
+            messagebox.showerror("Error", "Please enter a valid budget amount")
+            return
+        def clear_form():
             self.budget_amount_var.set("")
             self.budget_category_combo.set("")
             self.time_combo.set("Month")
-            self.refresh_data()
-        except ValueError:
-            messagebox.showerror("Error", "Please enter a valid budget amount")
-        except ValidationError as e:
-            messagebox.showerror("Validation Error", str(e))
-        except DatabaseError as e:
-            messagebox.showerror("Database Error", str(e))
+        self._run_write(self.database.create_budget, (budget,), clear_form)
     def delete_budget(self):
         """Delete selected budget"""
         if self.selected_budget_index == -1:
@@ -3116,17 +3645,15 @@ class MainApp:
             return
         budget = self.budgets[self.selected_budget_index]
         if messagebox.askyesno("Confirm Delete", f"Delete budget for '{budget['category_name']}'?"):
-            try:
-                self.database.delete_budget(budget['budget_id'], self.user.user_id)
+            def clear_selection():
                 self.selected_budget_index = -1
-                self.refresh_data()
-            except DatabaseError as e:
-                messagebox.showerror("Database Error", str(e))
+            self._run_write(self.database.delete_budget, (budget['budget_id'], self.user.user_id),
+                            clear_selection)
     def _create_monthly_summary_preview(self, parent_frame, report_data):
         """Create monthly summary report preview"""
         # Calculate summary statistics
-        total_income = sum(float(t['Amount']) for t in report_data['transactions'] if t['TransactionType'] == 'Income')
-        total_expenses = sum(float(t['Amount']) for t in report_data['transactions'] if t['TransactionType'] == 'Expense')
+        total_income = report_data['totals_by_type'].get('Income', 0.0)
+        total_expenses = report_data['totals_by_type'].get('Expense', 0.0)
         net_cashflow = total_income - total_expenses
         # Summary cards
         summary_frame = tk.Frame(parent_frame, bg=COLORS['WHITE'])
@@ -3137,14 +3664,14 @@ class MainApp:
         income_card.grid(row=0, column=0, sticky='ew', padx=(0,10), pady=5)
         tk.Label(income_card, text="Total Income", font=FONTS['FORM_LABEL'], 
                 fg=COLORS['BLACK'], bg=COLORS['GREEN']).pack(pady=(10,5))
-        tk.Label(income_card, text=f"{total_income:.2f} BDT", font=FONTS['VALUE'], 
+        tk.Label(income_card, text=format_bdt(total_income), font=FONTS['VALUE'], 
                 fg=COLORS['BLACK'], bg=COLORS['GREEN']).pack(pady=(0,10))
         # Expenses card
         expense_card = tk.Frame(summary_frame, bg=COLORS['GREY'], relief='solid', bd=1)
         expense_card.grid(row=0, column=1, sticky='ew', padx=5, pady=5)
         tk.Label(expense_card, text="Total Expenses", font=FONTS['FORM_LABEL'], 
                 fg=COLORS['BLACK'], bg=COLORS['GREY']).pack(pady=(10,5))
-        tk.Label(expense_card, text=f"{total_expenses:.2f} BDT", font=FONTS['VALUE'], 
+        tk.Label(expense_card, text=format_bdt(total_expenses), font=FONTS['VALUE'], 
                 fg=COLORS['BLACK'], bg=COLORS['GREY']).pack(pady=(0,10))
         # Net cashflow card
         cashflow_color = COLORS['GREEN'] if net_cashflow >= 0 else COLORS['RED']
@@ -3152,86 +3679,73 @@ class MainApp:
         cashflow_card.grid(row=0, column=2, sticky='ew', padx=(10,0), pady=5)
         tk.Label(cashflow_card, text="Net Cashflow", font=FONTS['FORM_LABEL'], 
                 fg=COLORS['WHITE'] if net_cashflow < 0 else COLORS['BLACK'], bg=cashflow_color).pack(pady=(10,5))
-        tk.Label(cashflow_card, text=f"{net_cashflow:.2f} BDT", font=FONTS['VALUE'], 
+        tk.Label(cashflow_card, text=format_bdt(net_cashflow), font=FONTS['VALUE'], 
                 fg=COLORS['WHITE'] if net_cashflow < 0 else COLORS['BLACK'], bg=cashflow_color).pack(pady=(0,10))
         # Add chart
-        self._create_trend_chart(parent_frame, report_data, "Income vs Expenses Trend")
+        self._lazy_chart(parent_frame, self._create_trend_chart, report_data, "Income vs Expenses Trend")
         # Recent transactions
         self._create_recent_transactions_section(parent_frame, report_data)
+    def _create_report_table(self, parent_frame, columns, rows):
+        """Pack a report table as one Treeview; columns are (heading, anchor), rows are (values, tag)"""
+        # Tall enough for every row; the preview canvas does the scrolling
+        column_ids = tuple(f"c{i}" for i in range(len(columns)))
+        tree = ttk.Treeview(parent_frame, columns=column_ids, show='headings', selectmode='none',
+                            height=max(len(rows), 1), style='Report.Treeview')
+        for column_id, (heading, anchor) in zip(column_ids, columns):
+            tree.heading(column_id, text=heading, anchor=anchor)
+            tree.column(column_id, anchor=anchor, stretch=True, width=120)
+        # Colour whole rows by sign, as the net/balance cells used to be
+        tree.tag_configure('pos', foreground=COLORS['GREEN'])
+        tree.tag_configure('neg', foreground=COLORS['RED'])
+        insert = tree.insert
+        for values, tag in rows:
+            insert('', 'end', values=values, tags=(tag,))
+        tree.pack(fill='x', padx=20, pady=(0,20))
+        return tree
     def _create_category_analysis_preview(self, parent_frame, report_data):
         """Create category analysis report preview"""
         tk.Label(parent_frame, text="Category Breakdown", font=FONTS['FORM_HEADER'], 
                 fg=COLORS['BLACK'], bg=COLORS['WHITE']).pack(anchor='w', padx=20, pady=(0,15))
-        # Calculate category totals
-        category_totals = {}
-        for transaction in report_data['transactions']:
-            if transaction['CategoryName'] and transaction['TransactionType'] in ['Income', 'Expense']:
-                category = transaction['CategoryName']
-                amount = float(transaction['Amount'])
-                trans_type = transaction['TransactionType']
-                if category not in category_totals:
-                    category_totals[category] = {'Income': 0, 'Expense': 0}
-                category_totals[category][trans_type] += amount
+        # Category totals are summed in SQL by get_report_data
+        category_totals = report_data['category_totals']
         if category_totals:
             # Create category table
-            table_frame = tk.Frame(parent_frame, bg=COLORS['WHITE'])
-            table_frame.pack(fill='x', padx=20, pady=(0,20))
-            # Headers
-            header_frame = tk.Frame(table_frame, bg=COLORS['GREY'], relief='solid', bd=1)
-            header_frame.pack(fill='x', pady=(0,1))
-            tk.Label(header_frame, text="Category", font=FONTS['FORM_LABEL'], 
-                    fg=COLORS['BLACK'], bg=COLORS['GREY']).pack(side='left', padx=10, pady=8)
-            tk.Label(header_frame, text="Income", font=FONTS['FORM_LABEL'], 
-                    fg=COLORS['BLACK'], bg=COLORS['GREY']).pack(side='right', padx=10, pady=8)
-            tk.Label(header_frame, text="Expenses", font=FONTS['FORM_LABEL'], 
-                    fg=COLORS['BLACK'], bg=COLORS['GREY']).pack(side='right', padx=10, pady=8)
-            tk.Label(header_frame, text="Net", font=FONTS['FORM_LABEL'], 
-                    fg=COLORS['BLACK'], bg=COLORS['GREY']).pack(side='right', padx=10, pady=8)
-            # Category rows
+            rows = []
             for category, amounts in category_totals.items():
                 net = amounts['Income'] - amounts['Expense']
-                row_frame = tk.Frame(table_frame, bg=COLORS['WHITE'], relief='solid', bd=1)
-                row_frame.pack(fill='x', pady=1)
-                tk.Label(row_frame, text=category, font=FONTS['LIST_ITEM'], 
-                        fg=COLORS['BLACK'], bg=COLORS['WHITE']).pack(side='left', padx=10, pady=5)
-                net_color = COLORS['GREEN'] if net >= 0 else COLORS['RED']
-                tk.Label(row_frame, text=f"{net:.2f}", font=FONTS['LIST_ITEM'], 
-                        fg=net_color, bg=COLORS['WHITE']).pack(side='right', padx=10, pady=5)
-                tk.Label(row_frame, text=f"{amounts['Expense']:.2f}", font=FONTS['LIST_ITEM'], 
-                        fg=COLORS['BLACK'], bg=COLORS['WHITE']).pack(side='right', padx=10, pady=5)
-                tk.Label(row_frame, text=f"{amounts['Income']:.2f}", font=FONTS['LIST_ITEM'], 
-                        fg=COLORS['BLACK'], bg=COLORS['WHITE']).pack(side='right', padx=10, pady=5)
+                rows.append(((category, _fmt2(amounts['Income']), _fmt2(amounts['Expense']), _fmt2(net)),
+                             'pos' if net >= 0 else 'neg'))
+            self._create_report_table(parent_frame,
+                                      [("Category", 'w'), ("Income", 'e'), ("Expenses", 'e'), ("Net", 'e')],
+                                      rows)
         # Add pie chart for expenses
-        self._create_expense_pie_chart(parent_frame, report_data)
+        self._lazy_chart(parent_frame, self._create_expense_pie_chart, report_data)
     def _create_account_performance_preview(self, parent_frame, report_data):
         """Create account performance report preview"""
         tk.Label(parent_frame, text="Account Performance", font=FONTS['FORM_HEADER'], 
                 fg=COLORS['BLACK'], bg=COLORS['WHITE']).pack(anchor='w', padx=20, pady=(0,15))
         # Account summary table
-        table_frame = tk.Frame(parent_frame, bg=COLORS['WHITE'])
-        table_frame.pack(fill='x', padx=20, pady=(0,20))
-        # Headers
-        header_frame = tk.Frame(table_frame, bg=COLORS['GREY'], relief='solid', bd=1)
-        header_frame.pack(fill='x', pady=(0,1))
-        tk.Label(header_frame, text="Account", font=FONTS['FORM_LABEL'], 
-                fg=COLORS['BLACK'], bg=COLORS['GREY']).pack(side='left', padx=10, pady=8)
-        tk.Label(header_frame, text="Type", font=FONTS['FORM_LABEL'], 
-                fg=COLORS['BLACK'], bg=COLORS['GREY']).pack(side='left', padx=50, pady=8)
-        tk.Label(header_frame, text="Current Balance", font=FONTS['FORM_LABEL'], 
-                fg=COLORS['BLACK'], bg=COLORS['GREY']).pack(side='right', padx=10, pady=8)
-        # Account rows
-        for account_id, account_info in report_data['accounts'].items():
-            row_frame = tk.Frame(table_frame, bg=COLORS['WHITE'], relief='solid', bd=1)
-            row_frame.pack(fill='x', pady=1)
-            tk.Label(row_frame, text=account_info['name'], font=FONTS['LIST_ITEM'], 
-                    fg=COLORS['BLACK'], bg=COLORS['WHITE']).pack(side='left', padx=10, pady=5)
-            tk.Label(row_frame, text=account_info['type'], font=FONTS['LIST_ITEM'], 
-                    fg=COLORS['BLACK'], bg=COLORS['WHITE']).pack(side='left', padx=50, pady=5)
-            balance_color = COLORS['GREEN'] if account_info['balance'] >= 0 else COLORS['RED']
-            tk.Label(row_frame, text=f"{account_info['balance']:.2f} BDT", font=FONTS['LIST_ITEM'], 
-                    fg=balance_color, bg=COLORS['WHITE']).pack(side='right', padx=10, pady=5)
+        rows = [((account_info['name'], account_info['type'], format_bdt(account_info['balance'])),
+                 'pos' if account_info['balance'] >= 0 else 'neg')
+                for account_info in report_data['accounts'].values()]
+        self._create_report_table(parent_frame,
+                                  [("Account", 'w'), ("Type", 'w'), ("Current Balance", 'e')],
+                                  rows)
         # Account activity chart
-        self._create_account_activity_chart(parent_frame, report_data)
+        self._lazy_chart(parent_frame, self._create_account_activity_chart, report_data)
+    def _create_progress_canvas(self, parent, height, fraction, color, text=None):
+        """Build a progress bar as one Canvas: a fill rectangle and an optional centred label"""
+        canvas = tk.Canvas(parent, height=height, bg=COLORS['LIGHT_GREY'], relief='solid', bd=1,
+                           highlightthickness=0)
+        fill = canvas.create_rectangle(0, 0, 0, height, fill=color, outline='')
+        label = canvas.create_text(0, height // 2, text=text, font=cached_font('inter', 9, 'bold'),
+                                   fill=COLORS['BLACK']) if text else None
+        def redraw(event):
+            canvas.coords(fill, 0, 0, int(event.width * fraction), event.height)
+            if label is not None:
+                canvas.coords(label, event.width // 2, event.height // 2)
+        canvas.bind('<Configure>', redraw)
+        return canvas
     def _create_budget_analysis_preview(self, parent_frame, report_data):
         """Create budget analysis report preview"""
         tk.Label(parent_frame, text="Budget vs Actual Spending", font=FONTS['FORM_HEADER'], 
@@ -3250,24 +3764,24 @@ class MainApp:
                 # Budget details
                 details_frame = tk.Frame(budget_frame, bg=COLORS['WHITE'])
                 details_frame.pack(fill='x', padx=15, pady=10)
-                tk.Label(details_frame, text=f"Budget: {budget['budget_amount']:.2f} BDT", 
-                        font=FONTS['LIST_ITEM'], fg=COLORS['BLACK'], bg=COLORS['WHITE']).pack(anchor='w')
-                tk.Label(details_frame, text=f"Spent: {budget['spent_amount']:.2f} BDT", 
-                        font=FONTS['LIST_ITEM'], fg=COLORS['BLACK'], bg=COLORS['WHITE']).pack(anchor='w')
-                tk.Label(details_frame, text=f"Remaining: {budget['remaining_amount']:.2f} BDT", 
+                # Budget and spent share one multi-line label instead of a widget each
+                tk.Label(details_frame, text=f"Budget: {format_bdt(budget['budget_amount'])}\n"
+                                             f"Spent: {format_bdt(budget['spent_amount'])}",
+                        font=FONTS['LIST_ITEM'], fg=COLORS['BLACK'], bg=COLORS['WHITE'],
+                        justify='left').pack(anchor='w')
+                tk.Label(details_frame, text=f"Remaining: {format_bdt(budget['remaining_amount'])}", 
                         font=FONTS['LIST_ITEM'], fg=COLORS['GREEN'] if budget['remaining_amount'] > 0 else COLORS['RED'], 
                         bg=COLORS['WHITE']).pack(anchor='w')
                 # Progress bar
-                progress_frame = tk.Frame(details_frame, bg=COLORS['LIGHT_GREY'], height=20, relief='solid', bd=1)
-                progress_frame.pack(fill='x', pady=(10,0))
-                progress_frame.pack_propagate(False)
                 if budget['budget_amount'] > 0:
                     spent_percentage = min(budget['spent_amount'] / budget['budget_amount'], 1.0)
-                    progress_color = COLORS['RED'] if spent_percentage > 0.8 else COLORS['YELLOW'] if spent_percentage > 0.6 else COLORS['GREEN']
-                    progress_fill = tk.Frame(progress_frame, bg=progress_color, height=20)
-                    progress_fill.place(relwidth=spent_percentage, relheight=1)
-                    tk.Label(progress_frame, text=f"{spent_percentage*100:.1f}%", 
-                            font=('inter', 9, 'bold'), fg=COLORS['BLACK'], bg=COLORS['LIGHT_GREY']).place(relx=0.5, rely=0.5, anchor='center')
+                    progress_color = next(color for threshold, color in BUDGET_PROGRESS_COLORS
+                                          if spent_percentage > threshold)
+                    progress_canvas = self._create_progress_canvas(details_frame, 20, spent_percentage, progress_color,
+                                                                   f"{spent_percentage*100:.1f}%")
+                else:
+                    progress_canvas = self._create_progress_canvas(details_frame, 20, 0.0, COLORS['GREEN'])
+                progress_canvas.pack(fill='x', pady=(10,0))
         else:
             tk.Label(parent_frame, text="No budgets found for this period", 
                     font=FONTS['LIST_ITEM'], fg=COLORS['GREY'], bg=COLORS['WHITE']).pack(anchor='w', padx=20, pady=10)
@@ -3284,6 +3798,84 @@ class MainApp:
         # Savings goals section
         if report_data['saving_goals']:
             self._create_savings_goals_progress(parent_frame, report_data['saving_goals'])
+    def _lazy_chart(self, parent_frame, build, *args):
+        """Reserve space for a preview chart and build it once it scrolls into view"""
+        placeholder = tk.Frame(parent_frame, bg=COLORS['WHITE'],
+                               height=REPORT_CONFIG['CHART_PLACEHOLDER_HEIGHT'])
+        placeholder.pack(fill='x')
+        self._pending_charts.append((placeholder, build, args))
+    def _build_visible_charts(self):
+        """Draw the pending preview charts whose placeholders overlap the visible area"""
+        if not self._pending_charts:
+            return
+        canvas = self._preview_canvas
+        # Nothing is laid out yet; the next view change will check again
+        if not canvas.winfo_ismapped() or canvas.winfo_height() <= 1:
+            return
+        view_top = canvas.winfo_rooty()
+        view_bottom = view_top + canvas.winfo_height()
+        pending = []
+        for placeholder, build, args in self._pending_charts:
+            if not placeholder.winfo_exists():
+                continue
+            top = placeholder.winfo_rooty()
+            if placeholder.winfo_ismapped() and top < view_bottom and top + placeholder.winfo_height() > view_top:
+                build(placeholder, *args)
+            else:
+                pending.append((placeholder, build, args))
+        self._pending_charts = pending
+    # Set once, before any preview Figure is drawn, so the render worker never sees them change
+    _preview_rc_applied = False
+    @classmethod
+    def _apply_preview_rc(cls):
+        """Apply PREVIEW_RC_PARAMS to matplotlib the first time a preview chart is built"""
+        if not cls._preview_rc_applied:
+            import matplotlib
+            matplotlib.rcParams.update(PREVIEW_RC_PARAMS)
+            cls._preview_rc_applied = True
+    def _preview_figure(self, slot, figsize):
+        """Return the cleared preview Figure for a chart slot, creating it on first use"""
+        fig = self._preview_figures.get(slot)
+        if fig is None or id(fig) in self._figures_in_flight:
+            # A Figure still being rendered belongs to the worker; give the slot a new one
+            from matplotlib.figure import Figure
+            self._apply_preview_rc()
+            fig = self._preview_figures[slot] = Figure(figsize=figsize, dpi=REPORT_CONFIG['PREVIEW_DPI'],
+                                                       facecolor='white')
+        else:
+            fig.clear()
+            fig.set_size_inches(*figsize)
+        return fig
+    @staticmethod
+    def _render_figure_png(fig):
+        """Rasterise a Figure with the Agg renderer and return it as PNG bytes"""
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        FigureCanvasAgg(fig)
+        buf = io.BytesIO()
+        fig.savefig(buf, format='png', dpi=fig.dpi, facecolor=fig.get_facecolor())
+        return buf.getvalue()
+    def _embed_figure(self, fig, chart_frame):
+        """Render a preview Figure on the render worker and show it in chart_frame"""
+        # The label keeps the chart's space while the worker draws it
+        label = tk.Label(chart_frame, text="Rendering chart...", bg='white',
+                         fg='#666666', font=FONTS['TRANSACTION_SUB'])
+        label.pack(fill='both', expand=True)
+        self._figures_in_flight.add(id(fig))
+        future = self._render_executor.submit(self._render_figure_png, fig)
+        def on_done(future):
+            self._figures_in_flight.discard(id(fig))
+            if not label.winfo_exists():
+                return
+            try:
+                png = future.result()
+            except Exception:
+                label.config(text="Chart could not be rendered")
+                return
+            # Tk decodes PNG natively, so no imaging library is needed for the blit
+            photo = tk.PhotoImage(data=base64.b64encode(png))
+            label.config(image=photo, text='')
+            label.image = photo
+        self._poll_future(future, on_done)
     def _create_trend_chart(self, parent_frame, report_data, title):
         """Create trend chart for transactions"""
         try:
@@ -3291,26 +3883,25 @@ class MainApp:
             chart_frame.pack(fill='x', padx=20, pady=10)
             tk.Label(chart_frame, text=title, font=FONTS['FORM_HEADER'], 
                     fg=COLORS['BLACK'], bg=COLORS['WHITE']).pack(anchor='w', pady=(0,10))
-            fig = Figure(figsize=(8, 4), dpi=80, facecolor='white')
+            import matplotlib.dates as mdates
+            import numpy as np  # always present alongside matplotlib
+            fig = self._preview_figure('trend', (6, 3))
             ax = fig.add_subplot(111)
-            # Group transactions by date
-            daily_data = {}
-            for transaction in report_data['transactions']:
-                date_str = transaction['Date_Created'][:10]  # Get date part
-                amount = float(transaction['Amount'])
-                trans_type = transaction['TransactionType']
-                if date_str not in daily_data:
-                    daily_data[date_str] = {'Income': 0, 'Expense': 0}
-                if trans_type in ['Income', 'Expense']:
-                    daily_data[date_str][trans_type] += amount
+            # Per-day totals come pre-grouped and sorted from get_report_data
+            daily_data = report_data['daily_totals']
             if daily_data:
-                dates = sorted(daily_data.keys())
-                incomes = [daily_data[date]['Income'] for date in dates]
-                expenses = [daily_data[date]['Expense'] for date in dates]
-                # Convert dates for plotting
-                date_objects = [datetime.strptime(date, '%Y-%m-%d') for date in dates]
-                ax.plot(date_objects, incomes, label='Income', color='green', marker='o')
-                ax.plot(date_objects, expenses, label='Expenses', color='red', marker='s')
+                # One pass over the items; no per-day lookups back into the dict
+                dates, days = zip(*daily_data.items())
+                incomes = [day['Income'] for day in days]
+                expenses = [day['Expense'] for day in days]
+                # Convert all ISO day strings in one call; matplotlib plots datetime64 natively
+                date_objects = np.array(dates, dtype='datetime64[D]')
+                # Markers dominate the draw cost on dense ranges, so long ranges are plain lines
+                dense = len(dates) > REPORT_CONFIG['TREND_MARKER_LIMIT']
+                ax.plot(date_objects, incomes, label='Income', color='green',
+                        marker=None if dense else 'o', solid_joinstyle='round')
+                ax.plot(date_objects, expenses, label='Expenses', color='red',
+                        marker=None if dense else 's', solid_joinstyle='round')
                 ax.set_title(title)
                 ax.set_ylabel('Amount (BDT)')
                 ax.legend()
@@ -3322,9 +3913,7 @@ class MainApp:
                 ax.text(0.5, 0.5, 'No data available for chart', ha='center', va='center', transform=ax.transAxes)
                 ax.set_title(title)
             # Embed chart in tkinter
-            canvas = FigureCanvasTkAgg(fig, chart_frame)
-            canvas.draw()
-            canvas.get_tk_widget().pack(fill='both', expand=True)
+            self._embed_figure(fig, chart_frame)
         except Exception as e:
             # Show error message
             error_label = tk.Label(chart_frame, text="Chart preview unavailable", 
@@ -3337,27 +3926,28 @@ class MainApp:
             chart_frame.pack(fill='x', padx=20, pady=10)
             tk.Label(chart_frame, text="Expense Distribution", font=FONTS['FORM_HEADER'], 
                     fg=COLORS['BLACK'], bg=COLORS['WHITE']).pack(anchor='w', pady=(0,10))
-            fig = Figure(figsize=(6, 6), dpi=80, facecolor='white')
+            fig = self._preview_figure('pie', (5, 5))
             ax = fig.add_subplot(111)
-            # Calculate expense categories
-            category_expenses = {}
-            for transaction in report_data['transactions']:
-                if transaction['TransactionType'] == 'Expense' and transaction['CategoryName']:
-                    category = transaction['CategoryName']
-                    amount = float(transaction['Amount'])
-                    category_expenses[category] = category_expenses.get(category, 0) + amount
+            # Expense totals per category come from get_report_data
+            category_expenses = report_data['expense_by_category']
             if category_expenses:
-                categories = list(category_expenses.keys())
-                amounts = list(category_expenses.values())
-                ax.pie(amounts, labels=categories, autopct='%1.1f%%', startangle=90)
+                # Largest categories first; the long tail is folded into one "Other" slice
+                slices = sorted(category_expenses.items(), key=lambda item: item[1], reverse=True)
+                max_slices = REPORT_CONFIG['PIE_MAX_SLICES']
+                other = sum(amount for _, amount in slices[max_slices:])
+                slices = slices[:max_slices]
+                if other:
+                    slices.append(('Other', other))
+                categories, amounts = zip(*slices)
+                min_pct = REPORT_CONFIG['PIE_MIN_LABEL_PCT']
+                ax.pie(amounts, labels=categories, startangle=90,
+                       autopct=lambda pct: f'{pct:.1f}%' if pct > min_pct else '')
                 ax.set_title('Expenses by Category')
             else:
                 ax.text(0.5, 0.5, 'No expense data available', ha='center', va='center', transform=ax.transAxes)
                 ax.set_title('Expenses by Category')
             # Embed chart in tkinter
-            canvas = FigureCanvasTkAgg(fig, chart_frame)
-            canvas.draw()
-            canvas.get_tk_widget().pack(fill='both', expand=True)
+            self._embed_figure(fig, chart_frame)
         except Exception as e:
             # Show error message
             error_label = tk.Label(chart_frame, text="Chart preview unavailable", 
@@ -3370,19 +3960,12 @@ class MainApp:
             chart_frame.pack(fill='x', padx=20, pady=10)
             tk.Label(chart_frame, text="Account Activity", font=FONTS['FORM_HEADER'], 
                     fg=COLORS['BLACK'], bg=COLORS['WHITE']).pack(anchor='w', pady=(0,10))
-            fig = Figure(figsize=(8, 4), dpi=80, facecolor='white')
+            fig = self._preview_figure('activity', (6, 3))
             ax = fig.add_subplot(111)
-            # Calculate account activity
-            account_activity = {}
-            for transaction in report_data['transactions']:
-                account_name = transaction['AccountName']
-                amount = float(transaction['Amount'])
-                if account_name not in account_activity:
-                    account_activity[account_name] = 0
-                account_activity[account_name] += amount
+            # Account activity comes pre-grouped from get_report_data
+            account_activity = report_data['account_activity']
             if account_activity:
-                accounts = list(account_activity.keys())
-                activity = list(account_activity.values())
+                accounts, activity = zip(*account_activity.items())
                 bars = ax.bar(accounts, activity, color=['green' if a > 0 else 'red' for a in activity], alpha=0.7)
                 ax.set_title('Transaction Volume by Account')
                 ax.set_ylabel('Total Transaction Amount (BDT)')
@@ -3392,14 +3975,14 @@ class MainApp:
                     ax.text(bar.get_x() + bar.get_width()/2., height,
                            f'{amount:.0f}', ha='center', va='bottom')
                 # Rotate x-axis labels if needed
-                plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
+                for label in ax.get_xticklabels():
+                    label.set_rotation(45)
+                    label.set_ha('right')
             else:
                 ax.text(0.5, 0.5, 'No account activity data', ha='center', va='center', transform=ax.transAxes)
                 ax.set_title('Transaction Volume by Account')
             # Embed chart in tkinter
-            canvas = FigureCanvasTkAgg(fig, chart_frame)
-            canvas.draw()
-            canvas.get_tk_widget().pack(fill='both', expand=True)
+            self._embed_figure(fig, chart_frame)
         except Exception as e:
             # Show error message
             error_label = tk.Label(chart_frame, text="Chart preview unavailable", 
@@ -3409,28 +3992,33 @@ class MainApp:
         """Create recent transactions section"""
         tk.Label(parent_frame, text="Recent Transactions", font=FONTS['FORM_HEADER'], 
                 fg=COLORS['BLACK'], bg=COLORS['WHITE']).pack(anchor='w', padx=20, pady=(20,10))
-        recent_transactions = report_data['transactions'][:10]  # Show last 10
+        recent_transactions = report_data['recent_transactions']
         if recent_transactions:
-            for transaction in recent_transactions:
-                trans_frame = tk.Frame(parent_frame, bg=COLORS['LIGHT_GREY'], relief='solid', bd=1)
-                trans_frame.pack(fill='x', padx=20, pady=2)
-                # Transaction details
-                details_frame = tk.Frame(trans_frame, bg=COLORS['LIGHT_GREY'])
-                details_frame.pack(fill='x', padx=10, pady=5)
+            # One Text widget for the whole list; amounts are right-aligned on a tab stop
+            txt = tk.Text(parent_frame, height=len(recent_transactions) * 3 - 1, font=FONTS['LIST_ITEM'],
+                          fg=COLORS['BLACK'], bg=COLORS['LIGHT_GREY'], relief='flat', bd=0,
+                          padx=10, pady=5, wrap='none', cursor='arrow')
+            txt.tag_configure('Income', foreground=COLORS['GREEN'])
+            txt.tag_configure('Expense', foreground=COLORS['RED'])
+            txt.tag_configure('Transfer', foreground=COLORS['BLUE'])
+            txt.bind('<Configure>', lambda event: txt.configure(tabs=(max(event.width - 30, 1), 'right')))
+            insert = txt.insert
+            for index, transaction in enumerate(recent_transactions):
+                if index:
+                    insert('end', '\n\n')
+                transaction_type = transaction['TransactionType']
                 # Left side - description and account
-                left_text = f"{transaction['Description'] or 'No description'}\n{transaction['AccountName']}"
+                account_line = transaction['AccountName']
                 if transaction['CategoryName']:
-                    left_text += f" • {transaction['CategoryName']}"
-                tk.Label(details_frame, text=left_text, font=FONTS['LIST_ITEM'], 
-                        fg=COLORS['BLACK'], bg=COLORS['LIGHT_GREY'], anchor='w', justify='left').pack(side='left')
+                    account_line += f" • {transaction['CategoryName']}"
                 # Right side - amount and date
-                amount = float(transaction['Amount'])
-                prefix = "+" if transaction['TransactionType'] == 'Income' else "-" if transaction['TransactionType'] == 'Expense' else "→"
-                amount_color = COLORS['GREEN'] if transaction['TransactionType'] == 'Income' else COLORS['RED'] if transaction['TransactionType'] == 'Expense' else COLORS['BLUE']
-                date_str = transaction['Date_Created'][:10]
-                right_text = f"{prefix}{amount:.2f} BDT\n{date_str}"
-                tk.Label(details_frame, text=right_text, font=FONTS['LIST_ITEM'], 
-                        fg=amount_color, bg=COLORS['LIGHT_GREY'], anchor='e', justify='right').pack(side='right')
+                prefix = TRANSACTION_PREFIX.get(transaction_type, "→")
+                insert('end', transaction['Description'] or 'No description')
+                insert('end', f"\t{prefix}{format_bdt(float(transaction['Amount']))}", transaction_type)
+                insert('end', f"\n{account_line}")
+                insert('end', f"\t{transaction['Date_Created'][:10]}", transaction_type)
+            txt.configure(state='disabled')
+            txt.pack(fill='x', padx=20, pady=2)
         else:
             tk.Label(parent_frame, text="No transactions found for this period", 
                     font=FONTS['LIST_ITEM'], fg=COLORS['GREY'], bg=COLORS['WHITE']).pack(anchor='w', padx=20, pady=10)
@@ -3446,11 +4034,8 @@ class MainApp:
                 tk.Label(goal_frame, text=f"{goal.goal_name}: {goal.current_amount:.2f} / {goal.target_amount:.2f} BDT ({progress:.1f}%)", 
                         font=FONTS['LIST_ITEM'], fg=COLORS['BLACK'], bg=COLORS['WHITE']).pack(anchor='w')
                 # Progress bar
-                progress_frame = tk.Frame(goal_frame, bg=COLORS['LIGHT_GREY'], height=15, relief='solid', bd=1)
-                progress_frame.pack(fill='x', pady=(5,0))
-                progress_frame.pack_propagate(False)
-                progress_fill = tk.Frame(progress_frame, bg=COLORS['GREEN'], height=15)
-                progress_fill.place(relwidth=min(progress/100, 1.0), relheight=1)
+                self._create_progress_canvas(goal_frame, 15, min(progress/100, 1.0),
+                                             COLORS['GREEN']).pack(fill='x', pady=(5,0))
 
 # =============================================================================
 # APPLICATION CONTROLLER
@@ -3459,11 +4044,22 @@ class FinanceApp:
     """Main application controller"""
     def __init__(self):
 
-        self.main_root = None
-        self.login_window = None
+        # One Tk root serves the login, register and main screens in turn
+        self.root = tk.Tk()
+        self.root.withdraw()
+        # Widgets then pass font names instead of marshalling FONTS tuples each time
+        register_named_fonts(self.root)
+        # Screen size never changes while the app runs, so centering reads it once
+        self._screen_width = self.root.winfo_screenwidth()
+        self._screen_height = self.root.winfo_screenheight()
         self.database = None
         self.current_user = None
         self.current_screen = None
+        # Refuse to run with seed data or limits that differ from the shipped values
+        if config_digest() != CONFIG_SHA256:
+            messagebox.showerror("Configuration Error",
+                                 "Application settings have been modified and failed the integrity check.")
+            sys.exit(1)
         # Initialize database first
         try:
             self.database = Database()
@@ -3472,105 +4068,63 @@ class FinanceApp:
             sys.exit(1)
         # Start with login popup
         self.show_login_popup()
+    def _clear_root(self):
+        """Remove the current screen's widgets and global bindings from the root window"""
+        # Screens cancel their own after() callbacks in close()
+        self.root.unbind_all("<MouseWheel>")
+        for widget in self.root.winfo_children():
+            widget.destroy()
+    def _mount_screen(self, screen_cls, width, height, title, **kwargs):
+        """Clear the root, size and center it, and mount screen_cls into it"""
+        self._clear_root()
+        x = (self._screen_width - width) // 2
+        y = (self._screen_height - height) // 2
+        self.root.geometry(f"{width}x{height}+{x}+{y}")
+        self.root.title(title)
+        self.current_screen = screen_cls(parent=self.root, database=self.database, **kwargs)
     def show_login_popup(self):
         """Show compact login popup window"""
         try:
-            # Create small popup window for login
-            self.login_window = tk.Tk()
-            self.login_window.title("Finance Manager - Login")
-            self.login_window.geometry("400x450")
-            self.login_window.resizable(False, False)
-            # Center the window on screen
-            self.login_window.update_idletasks()
-            width = self.login_window.winfo_width()
-            height = self.login_window.winfo_height()
-            x = (self.login_window.winfo_screenwidth() // 2) - (width // 2)
-            y = (self.login_window.winfo_screenheight() // 2) - (height // 2)
-            self.login_window.geometry(f"{width}x{height}+{x}+{y}")
-
+            self.root.resizable(False, False)
             # Set up window close handler
-            self.login_window.protocol("WM_DELETE_WINDOW", self.on_login_closing)
-            self.current_screen = LoginScreen(
-                parent=self.login_window,
-                database=self.database,
-                on_login_success=self.on_login_success,
-                on_show_register=self.show_register_popup
-            )
+            self.root.protocol("WM_DELETE_WINDOW", self.on_login_closing)
+            self._mount_screen(LoginScreen, 400, 450, "Finance Manager - Login",
+                               on_login_success=self.on_login_success,
+                               on_show_register=self.show_register_popup)
+            self.root.deiconify()
         except Exception as e:
             messagebox.showerror("Error", f"Failed to show login screen: {e}")
     def show_register_popup(self):
         """Show compact registration popup window"""
         try:
-            # Clear current window
-            for widget in self.login_window.winfo_children():
-                widget.destroy()
-            # Resize window for registration (taller to accommodate more fields)
-            self.login_window.geometry("400x520")
-            # Center the window on screen after resize
-            self.login_window.update_idletasks()
-            width = self.login_window.winfo_width()
-            height = self.login_window.winfo_height()
-            x = (self.login_window.winfo_screenwidth() // 2) - (width // 2)
-            y = (self.login_window.winfo_screenheight() // 2) - (height // 2)
-            self.login_window.geometry(f"{width}x{height}+{x}+{y}")
-            self.login_window.title("Finance Manager - Register")
-            self.current_screen = RegisterScreen(
-                parent=self.login_window,
-                database=self.database,
-                on_register_success=self.on_register_success,
-                on_show_login=self.show_login_popup_content
-            )
+            # Taller than the login window to accommodate more fields
+            self._mount_screen(RegisterScreen, 400, 520, "Finance Manager - Register",
+                               on_register_success=self.on_register_success,
+                               on_show_login=self.show_login_popup)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to show register screen: {e}")
-    def show_login_popup_content(self):
-        """Show login content in existing popup window"""
-        try:
-            # Clear current window
-            for widget in self.login_window.winfo_children():
-                widget.destroy()
-            # Resize back to login size (smaller)
-            self.login_window.geometry("400x450")
-            # Center the window on screen after resize
-            self.login_window.update_idletasks()
-            width = self.login_window.winfo_width()
-            height = self.login_window.winfo_height()
-            x = (self.login_window.winfo_screenwidth() // 2) - (width // 2)
-            y = (self.login_window.winfo_screenheight() // 2) - (height // 2)
-            self.login_window.geometry(f"{width}x{height}+{x}+{y}")
-            self.login_window.title("Finance Manager - Login")
-            self.current_screen = LoginScreen(
-                parent=self.login_window,
-                database=self.database,
-                on_login_success=self.on_login_success,
-                on_show_register=self.show_register_popup
-            )
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to show login screen: {e}")
     def on_register_success(self):
         """Handle successful registration"""
         messagebox.showinfo("Success", "Registration successful! Please login.")
-        self.show_login_popup_content()
+        self.show_login_popup()
     def on_login_success(self, user):
         """Handle successful login"""
         try:
             self.current_user = user
-            # Close login popup
-            self.login_window.destroy()
-            self.login_window = None
-            # Create main application window
+            # Clear the login screen from the shared root
+            self._clear_root()
+            # Turn the root into the main application window
             self.create_main_window()
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load main application: {e}")
     def create_main_window(self):
         """Create the main application window after successful login"""
         try:
-            # Create main window
-            self.main_root = tk.Tk()
-            self.main_root.title(WINDOW_TITLE)
-            self.main_root.geometry(WINDOW_SIZE)
-            self.main_root.resizable(True, True)
+            self.root.title(WINDOW_TITLE)
+            self.root.geometry(WINDOW_SIZE)
+            self.root.resizable(True, True)
             # Set up window close handler
-            self.main_root.protocol("WM_DELETE_WINDOW", self.on_closing)
+            self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
             # Show main application
             self.show_main_app()
         except Exception as e:
@@ -3579,7 +4133,7 @@ class FinanceApp:
         """Show the main application"""
         try:
             self.current_screen = MainApp(
-                parent=self.main_root,
+                parent=self.root,
                 database=self.database,
                 user=self.current_user,
                 on_logout=self.on_logout
@@ -3590,10 +4144,10 @@ class FinanceApp:
         """Handle user logout"""
         try:
             self.current_user = None
-            # Close main window
-            if self.main_root:
-                self.main_root.destroy()
-                self.main_root = None
+            if hasattr(self.current_screen, 'close'):
+                self.current_screen.close()
+            # Hide the root while it switches back to the login layout
+            self.root.withdraw()
             # Show login popup again
             self.show_login_popup()
         except Exception as e:
@@ -3618,19 +4172,23 @@ class FinanceApp:
             sys.exit(0)
     def cleanup_and_exit(self):
         """Cleanup resources and exit"""
-        # Close database connection
-        if hasattr(self.database, 'close') and self.database:
-            self.database.close()
-        # Destroy windows
-        if self.main_root:
-            self.main_root.destroy()
-        if self.login_window:
-            self.login_window.destroy()
+        # Stop background work before the database goes away
+        try:
+            if hasattr(self.current_screen, 'close'):
+                self.current_screen.close()
+        finally:
+            # Close database connection
+            if hasattr(self.database, 'close') and self.database:
+                self.database.close()
+        # Destroy the root window
+        if self.root:
+            self.root.destroy()
+            self.root = None
     def run(self):
         """Start the application"""
         try:
-            if self.login_window:
-                self.login_window.mainloop()
+            if self.root:
+                self.root.mainloop()
         except KeyboardInterrupt:
             self.cleanup_and_exit()
         except Exception as e: